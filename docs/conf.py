@@ -3,7 +3,9 @@ import os
 import sys
 
 # Add the package source to Python path for autodoc
-sys.path.insert(0, os.path.abspath('../src'))
+src_path = os.path.abspath('../src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import version from package
 try:
@@ -20,6 +22,8 @@ author = 'Jack Zhang'
 version = release
 
 # -- General configuration ---------------------------------------------------
+# All extensions below declare parallel_read_safe/parallel_write_safe, so the
+# build can run with `sphinx-build -j auto` (the Makefile default).
 extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.viewcode',
@@ -32,9 +36,11 @@ extensions = [
 source_suffix = ['.rst', '.md']
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', 'README.md']
+exclude_patterns = ['_build', '.doctrees', 'Thumbs.db', '.DS_Store', 'README.md']
 
 # -- Options for HTML output -------------------------------------------------
+# Keep config values picklable (strings, numbers, dicts, lists) so Sphinx can
+# cache the environment; reference callables by dotted path instead.
 html_theme = 'furo'
 html_title = 'Visual Layer SDK'
 
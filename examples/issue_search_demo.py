@@ -3,32 +3,46 @@
 Demo script showing how to use the issue search functionality in the Visual Layer SDK.
 """
 
+import argparse
 import os
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Add the src directory to the path so we can import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from visual_layer_sdk.client import VisualLayerClient
-from visual_layer_sdk.dataset import Dataset
+from visual_layer_sdk.client import VisualLayerClient  # noqa: E402
+from visual_layer_sdk.dataset import Dataset, IssueType, SearchOperator  # noqa: E402
+
+# Severity level -> display name, indexed by the numeric severity (0=High, 1=Medium, 2=Low)
+SEVERITY_NAMES = ("High", "Medium", "Low")
+
+# Banner separators shared by all demos
+SEP = "=" * 60
+HR = "-" * 50
 
 
 def demo_issue_type_mapping():
     """Demo: Show issue type ID to name mapping"""
     print("🚀 Visual Layer SDK - Issue Search Demo")
-    print("=" * 60)
+    print(SEP)
 
     print("📋 Issue Type ID to Name Mapping:")
-    print("-" * 50)
+    print(HR)
 
     issue_mapping = Dataset.list_available_issue_types()
-    print("| ID | Issue Type Name | Description | Severity |")
-    print("|----|-----------------|-------------|----------|")
+    rows = ["| ID | Issue Type Name | Description | Severity |", "|----|-----------------|-------------|----------|"]
 
     for issue_id, info in issue_mapping.items():
-        severity_name = {0: "High", 1: "Medium", 2: "Low"}[info["severity"]]
-        print(f"| {issue_id} | {info['name']:<15} | {info['description']:<11} | {severity_name:<8} |")
+        severity_name = SEVERITY_NAMES[info["severity"]]
+        rows.append(f"| {issue_id} | {info['name']:<15} | {info['description']:<11} | {severity_name:<8} |")
+
+    # Emit the whole table with a single write instead of one print per row
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print("\n💡 Severity Levels:")
     print("• 0: High severity (mislabels, outliers, duplicates, normal, label_outlier)")
@@ -36,149 +50,98 @@ def demo_issue_type_mapping():
     print("• 2: Low severity (bright)")
 
 
-def demo_issue_search_by_ids(client, dataset_id):
-    """Demo: Search by issue type IDs"""
-    print("\n" + "=" * 60)
-    print("DEMO: Search by Issue Type IDs")
-    print("=" * 60)
+def issue_types_for_ids(issue_ids):
+    """Map issue type IDs (0-7) to IssueType members"""
+    return [IssueType(Dataset.get_issue_type_info(issue_id=issue_id)["name"]) for issue_id in issue_ids]
 
-    dataset = Dataset(client, dataset_id)
 
-    # Search for high-severity issues (IDs 0, 1, 2, 6, 7)
-    print("🔍 Searching for high-severity issues (IDs: 0, 1, 2, 6, 7)...")
-    high_severity_results = dataset.search_by_issues(issue_types=[0, 1, 2, 6, 7])
-    print(f"✅ Found {len(high_severity_results)} images with high-severity issues")
-
-    # Search for image quality issues (IDs 3, 4, 5)
-    print("\n🔍 Searching for image quality issues (IDs: 3, 4, 5)...")
-    quality_results = dataset.search_by_issues(issue_types=[3, 4, 5])
-    print(f"✅ Found {len(quality_results)} images with quality issues")
+def demo_issue_search_by_ids(dataset):
+    """Demo: Search by issue type IDs"""
+    print("\n" + SEP)
+    print("DEMO: Search by Issue Type IDs")
+    print(SEP)
 
-    # Search for specific issue types
-    print("\n🔍 Searching for blurry images (ID: 3)...")
-    blur_results = dataset.search_by_issues(issue_types=[3])
-    print(f"✅ Found {len(blur_results)} blurry images")
+    # The searches are independent, so run them concurrently over the client's shared session
+    searches = [
+        ("high-severity issues (IDs: 0, 1, 2, 6, 7)", [0, 1, 2, 6, 7]),
+        ("image quality issues (IDs: 3, 4, 5)", [3, 4, 5]),
+        ("blurry images (ID: 3)", [3]),
+        ("duplicate images (ID: 2)", [2]),
+    ]
+    print(f"🔍 Running {len(searches)} issue searches concurrently...")
+    with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+        counts = list(executor.map(lambda search: dataset.count_by_issues(issue_type=issue_types_for_ids(search[1]), search_operator=SearchOperator.IS_ONE_OF), searches))
 
-    print("\n🔍 Searching for duplicate images (ID: 2)...")
-    duplicate_results = dataset.search_by_issues(issue_types=[2])
-    print(f"✅ Found {len(duplicate_results)} duplicate images")
+    for (description, _), count in zip(searches, counts):
+        print(f"✅ Found {count} images for {description}")
 
 
-def demo_issue_search_by_names(client, dataset_id):
+def demo_issue_search_by_names(dataset):
     """Demo: Search by issue type names"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: Search by Issue Type Names")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
+    print(SEP)
 
     # Search for blurry images by name
     print("🔍 Searching for blurry images by name...")
-    blur_results = dataset.search_by_issues(issue_types=["blur"])
-    print(f"✅ Found {len(blur_results)} blurry images")
+    blur_count = dataset.count_by_issues(issue_type=IssueType("blur"))
+    print(f"✅ Found {blur_count} blurry images")
 
     # Search for multiple issue types by name
     print("\n🔍 Searching for dark and bright images...")
-    lighting_results = dataset.search_by_issues(issue_types=["dark", "bright"])
-    print(f"✅ Found {len(lighting_results)} images with lighting issues")
+    lighting_count = dataset.count_by_issues(issue_type=[IssueType("dark"), IssueType("bright")], search_operator=SearchOperator.IS_ONE_OF)
+    print(f"✅ Found {lighting_count} images with lighting issues")
 
     # Search for outliers and mislabels
     print("\n🔍 Searching for outliers and mislabels...")
-    data_quality_results = dataset.search_by_issues(issue_types=["outliers", "mislabels"])
-    print(f"✅ Found {len(data_quality_results)} images with data quality issues")
+    data_quality_count = dataset.count_by_issues(issue_type=[IssueType.OUTLIERS, IssueType.MISLABELS], search_operator=SearchOperator.IS_ONE_OF)
+    print(f"✅ Found {data_quality_count} images with data quality issues")
 
 
-def demo_vql_search(client, dataset_id):
+def demo_vql_search(dataset):
     """Demo: Search using VQL (Visual Query Language)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: Search using VQL (Visual Query Language)")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
-
-    # VQL query for high-severity issues
-    print("🔍 Searching with VQL for high-severity issues...")
-    vql_query = '{"issue_type": ["mislabels", "outliers", "duplicates"], "severity": [0]}'
-    vql_results = dataset.search_by_issues(issue_types=vql_query)
-    print(f"✅ Found {len(vql_results)} images with high-severity issues using VQL")
-
-    # VQL query for image quality issues with confidence threshold
-    print("\n🔍 Searching with VQL for quality issues with confidence > 0.8...")
-    quality_vql = '{"issue_type": ["blur", "dark", "bright"], "confidence": {"min": 0.8}}'
-    quality_results = dataset.search_by_issues(issue_types=quality_vql)
-    print(f"✅ Found {len(quality_results)} images with quality issues (confidence > 0.8)")
-
-
-def demo_severity_filtering(client, dataset_id):
-    """Demo: Filter by severity levels"""
-    print("\n" + "=" * 60)
-    print("DEMO: Filter by Severity Levels")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
-
-    # Search for high-severity issues only
-    print("🔍 Searching for high-severity issues only...")
-    high_severity = dataset.search_by_issues(severity_levels=[0])
-    print(f"✅ Found {len(high_severity)} images with high-severity issues")
-
-    # Search for medium and low severity issues
-    print("\n🔍 Searching for medium and low severity issues...")
-    medium_low = dataset.search_by_issues(severity_levels=[1, 2])
-    print(f"✅ Found {len(medium_low)} images with medium/low severity issues")
-
-    # Search for all severity levels
-    print("\n🔍 Searching for all severity levels...")
-    all_severities = dataset.search_by_issues(severity_levels=[0, 1, 2])
-    print(f"✅ Found {len(all_severities)} images with any severity issues")
-
-
-def demo_confidence_filtering(client, dataset_id):
-    """Demo: Filter by confidence threshold"""
-    print("\n" + "=" * 60)
-    print("DEMO: Filter by Confidence Threshold")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
+    print(SEP)
+
+    # VQL query for blurry images
+    print("🔍 Searching with VQL for blurry images...")
+    vql_query = [{"issues": {"op": "issue", "value": "blur", "confidence_min": 0.8, "confidence_max": 1.0, "mode": "in"}}]
+    vql_count = dataset.count_by_vql(vql_query)
+    print(f"✅ Found {vql_count} blurry images using VQL")
+
+    # VQL filters combine with AND: dark images that are also duplicates
+    print("\n🔍 Searching with VQL for dark images that are also duplicates...")
+    combined_vql = [
+        {"issues": {"op": "issue", "value": "dark", "confidence_min": 0.8, "confidence_max": 1.0, "mode": "in"}},
+        {"issues": {"op": "issue", "value": "duplicates", "confidence_min": 0.8, "confidence_max": 1.0, "mode": "in"}},
+    ]
+    combined_count = dataset.count_by_vql(combined_vql)
+    print(f"✅ Found {combined_count} dark duplicate images using VQL")
+
+
+def demo_confidence_filtering(dataset):
+    """Demo: Filter by confidence range"""
+    print("\n" + SEP)
+    print("DEMO: Filter by Confidence Range")
+    print(SEP)
 
     # Search with high confidence threshold
-    print("🔍 Searching for issues with confidence > 0.9...")
-    high_confidence = dataset.search_by_issues(confidence_threshold=0.9)
-    print(f"✅ Found {len(high_confidence)} images with high-confidence issues")
+    print("🔍 Searching for blurry images with confidence >= 0.9...")
+    high_confidence_count = dataset.count_by_issues(issue_type=IssueType.BLUR, confidence_min=0.9)
+    print(f"✅ Found {high_confidence_count} images with high-confidence blur")
 
     # Search with medium confidence threshold
-    print("\n🔍 Searching for issues with confidence > 0.7...")
-    medium_confidence = dataset.search_by_issues(confidence_threshold=0.7)
-    print(f"✅ Found {len(medium_confidence)} images with medium-confidence issues")
-
-
-def demo_combined_filters(client, dataset_id):
-    """Demo: Combine multiple filters"""
-    print("\n" + "=" * 60)
-    print("DEMO: Combined Filters")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
-
-    # Combine issue types with severity and confidence
-    print("🔍 Searching for high-severity blur/dark issues with confidence > 0.8...")
-    combined_results = dataset.search_by_issues(issue_types=["blur", "dark"], severity_levels=[1], confidence_threshold=0.8)
-    print(f"✅ Found {len(combined_results)} images matching combined criteria")
+    print("\n🔍 Searching for blurry or dark images with confidence >= 0.7...")
+    medium_confidence_count = dataset.count_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_ONE_OF, confidence_min=0.7)
+    print(f"✅ Found {medium_confidence_count} blurry or dark images with confidence >= 0.7")
 
-    # Combine with additional filters
-    print("\n🔍 Searching with additional filters...")
-    additional_filters = {"labels": ["cat", "dog"], "origins": ["VL"]}  # Only images with cat or dog labels  # Only Visual Layer generated images
-    filtered_results = dataset.search_by_issues(issue_types=["mislabels", "outliers"], additional_filters=additional_filters)
-    print(f"✅ Found {len(filtered_results)} images with data quality issues in cat/dog images")
 
-
-def demo_issue_management(client, dataset_id):
+def demo_issue_management(dataset):
     """Demo: Issue management functions"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: Issue Management Functions")
-    print("=" * 60)
-
-    dataset = Dataset(client, dataset_id)
+    print(SEP)
 
     # Get available issue types for this dataset
     print("📋 Getting available issue types for this dataset...")
@@ -201,9 +164,9 @@ def demo_issue_management(client, dataset_id):
 
 def demo_issue_info_utilities():
     """Demo: Issue information utility functions"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: Issue Information Utilities")
-    print("=" * 60)
+    print(SEP)
 
     # Get information about specific issue types
     print("🔍 Getting information about specific issue types...")
@@ -223,9 +186,29 @@ def demo_issue_info_utilities():
         print(f"  {issue_id}: {info['name']} - {info['description']} (Severity: {info['severity']})")
 
 
+# All demos in run order; selectable with --demo
+DEMOS = {
+    "mapping": demo_issue_type_mapping,
+    "ids": demo_issue_search_by_ids,
+    "names": demo_issue_search_by_names,
+    "vql": demo_vql_search,
+    "confidence": demo_confidence_filtering,
+    "management": demo_issue_management,
+    "info": demo_issue_info_utilities,
+}
+
+# Demos that only use the local issue type mapping and need no Dataset
+OFFLINE_DEMOS = {"mapping", "info"}
+
+
 def main():
     """Run all issue search demos"""
 
+    parser = argparse.ArgumentParser(description="Visual Layer SDK issue search demo")
+    parser.add_argument("--demo", nargs="+", choices=list(DEMOS), help="Run only the selected demos (default: all)")
+    args = parser.parse_args()
+    selected = args.demo or list(DEMOS)
+
     # Load environment variables
     load_dotenv()
 
@@ -238,59 +221,52 @@ def main():
         print("Please set VISUAL_LAYER_API_KEY and VISUAL_LAYER_API_SECRET in your .env file")
         return
 
-    # Initialize client
-    print("🚀 Initializing Visual Layer client...")
-    client = VisualLayerClient(API_KEY, API_SECRET)
-
     # Test dataset ID (you can change this to a real dataset ID)
     test_dataset_id = "5db7f426-4fdf-11ef-8d8b-5e82a4538d0f"
 
     try:
-        # Run all demos
-        demo_issue_type_mapping()
-        demo_issue_search_by_ids(client, test_dataset_id)
-        demo_issue_search_by_names(client, test_dataset_id)
-        demo_vql_search(client, test_dataset_id)
-        demo_severity_filtering(client, test_dataset_id)
-        demo_confidence_filtering(client, test_dataset_id)
-        demo_combined_filters(client, test_dataset_id)
-        demo_issue_management(client, test_dataset_id)
-        demo_issue_info_utilities()
+        # Only connect when a selected demo needs the API, and share one Dataset across those demos
+        dataset = None
+        if any(name not in OFFLINE_DEMOS for name in selected):
+            print("🚀 Initializing Visual Layer client...")
+            client = VisualLayerClient(API_KEY, API_SECRET)
+            dataset = Dataset(client, test_dataset_id)
+
+        for name in selected:
+            if name in OFFLINE_DEMOS:
+                DEMOS[name]()
+            else:
+                DEMOS[name](dataset)
 
     except Exception as e:
         print(f"❌ Error during demo: {str(e)}")
-        import traceback
-
         print(f"Full error: {traceback.format_exc()}")
 
-    print("\n" + "=" * 60)
-    print("📝 SUMMARY OF ISSUE SEARCH FEATURES")
-    print("=" * 60)
-
-    print("\n🎯 Search Methods:")
-    print("• Search by issue type IDs (0-7)")
-    print("• Search by issue type names (mislabels, outliers, etc.)")
-    print("• Search using VQL (Visual Query Language)")
-    print("• Filter by severity levels (0=High, 1=Medium, 2=Low)")
-    print("• Filter by confidence threshold")
-    print("• Combine multiple filters")
-
-    print("\n🔧 Management Functions:")
-    print("• Get available issue types for dataset")
-    print("• Get dataset issues with filtering")
-    print("• Get cluster-specific issues")
-    print("• Get image-specific issues")
-    print("• Get issue type information")
-
-    print("\n💡 Use Cases:")
-    print("• Find problematic images for review")
-    print("• Identify data quality issues")
-    print("• Filter by confidence for reliable results")
-    print("• Combine with other filters for targeted search")
-    print("• Export issue data for analysis")
-
-    print("\n✅ Demo Complete!")
-    print("The issue search functionality provides comprehensive tools for finding and managing data quality issues.")
+    summary = [
+        "\n" + SEP,
+        "📝 SUMMARY OF ISSUE SEARCH FEATURES",
+        SEP,
+        "\n🎯 Search Methods:",
+        "• Search by issue type IDs (0-7)",
+        "• Search by issue type names (mislabels, outliers, etc.)",
+        "• Search using VQL (Visual Query Language)",
+        "• Filter by confidence range",
+        "\n🔧 Management Functions:",
+        "• Get available issue types for dataset",
+        "• Get dataset issues with filtering",
+        "• Get cluster-specific issues",
+        "• Get image-specific issues",
+        "• Get issue type information",
+        "\n💡 Use Cases:",
+        "• Find problematic images for review",
+        "• Identify data quality issues",
+        "• Filter by confidence for reliable results",
+        "• Combine with other filters for targeted search",
+        "• Export issue data for analysis",
+        "\n✅ Demo Complete!",
+        "The issue search functionality provides comprehensive tools for finding and managing data quality issues.",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":
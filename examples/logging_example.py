@@ -8,11 +8,16 @@ import sys
 from dotenv import load_dotenv
 
 # Add the src directory to the path so we can import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from visual_layer_sdk.client import VisualLayerClient
-from visual_layer_sdk.logger import get_logger, set_verbose, set_log_level
-import logging
+from visual_layer_sdk.client import VisualLayerClient  # noqa: E402
+from visual_layer_sdk.logger import get_logger, set_verbose, set_log_level  # noqa: E402
+import logging  # noqa: E402
+
+# Banner separators shared by all demos
+SEP = "=" * 50
 
 
 def main():
@@ -35,9 +40,9 @@ def main():
     client = VisualLayerClient(API_KEY, API_SECRET)
 
     # Example 1: Normal logging (INFO level)
-    print("\n" + "=" * 50)
+    print("\n" + SEP)
     print("EXAMPLE 1: Normal Logging (INFO level)")
-    print("=" * 50)
+    print(SEP)
 
     try:
         # Health check
@@ -52,9 +57,9 @@ def main():
         client.logger.error(f"Error in normal logging example: {str(e)}")
 
     # Example 2: Verbose logging (DEBUG level)
-    print("\n" + "=" * 50)
+    print("\n" + SEP)
     print("EXAMPLE 2: Verbose Logging (DEBUG level)")
-    print("=" * 50)
+    print(SEP)
 
     # Enable verbose logging
     set_verbose(True)
@@ -69,9 +74,9 @@ def main():
         client.logger.error(f"Error in verbose logging example: {str(e)}")
 
     # Example 3: Dataset operations with natural messages
-    print("\n" + "=" * 50)
+    print("\n" + SEP)
     print("EXAMPLE 3: Dataset Operations")
-    print("=" * 50)
+    print(SEP)
 
     # Reset to normal logging
     set_verbose(False)
@@ -104,9 +109,9 @@ def main():
         client.logger.error(f"Error in dataset operations example: {str(e)}")
 
     # Example 4: Error handling
-    print("\n" + "=" * 50)
+    print("\n" + SEP)
     print("EXAMPLE 4: Error Handling")
-    print("=" * 50)
+    print(SEP)
 
     try:
         # Simulate various error scenarios
@@ -121,9 +126,9 @@ def main():
     except Exception as e:
         client.logger.error(f"Error in error handling example: {str(e)}")
 
-    print("\n" + "=" * 50)
+    print("\n" + SEP)
     print("✅ Logging Examples Complete!")
-    print("=" * 50)
+    print(SEP)
 
     print("\n📝 Summary of logging features:")
     print("• Natural, user-friendly messages with emojis")
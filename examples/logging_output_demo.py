@@ -3,21 +3,29 @@
 Demo script showing different logging output destinations for the Visual Layer SDK.
 """
 
+import logging
 import os
+import shutil
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
 
 # Add the src directory to the path so we can import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from visual_layer_sdk.logger import configure_logging, log_to_console_only, log_to_file_only, log_to_console_and_file, log_to_stderr, get_logger, get_log_file_path, set_verbose
+from visual_layer_sdk.logger import configure_logging, log_to_console_only, log_to_file_only, log_to_console_and_file, log_to_stderr, get_logger, get_log_file_path, set_verbose  # noqa: E402
+
+# Banner separators shared by all demos
+SEP = "=" * 60
+HR = "-" * 40
 
 
 def demo_console_only():
     """Demo: Log to console only (default behavior)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 1: Console Only Logging (Default)")
-    print("=" * 60)
+    print(SEP)
 
     log_to_console_only()
     logger = get_logger()
@@ -32,9 +40,9 @@ def demo_console_only():
 
 def demo_file_only():
     """Demo: Log to file only"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 2: File Only Logging")
-    print("=" * 60)
+    print(SEP)
 
     log_file = "logs/demo_file_only.log"
     log_to_file_only(log_file)
@@ -51,9 +59,9 @@ def demo_file_only():
 
 def demo_console_and_file():
     """Demo: Log to both console and file"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 3: Console and File Logging")
-    print("=" * 60)
+    print(SEP)
 
     log_file = "logs/demo_console_and_file.log"
     log_to_console_and_file(log_file)
@@ -69,9 +77,9 @@ def demo_console_and_file():
 
 def demo_stderr():
     """Demo: Log to stderr"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 4: Stderr Logging")
-    print("=" * 60)
+    print(SEP)
 
     log_to_stderr()
     logger = get_logger()
@@ -86,9 +94,9 @@ def demo_stderr():
 
 def demo_verbose_logging():
     """Demo: Verbose logging with different destinations"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 5: Verbose Logging with File Output")
-    print("=" * 60)
+    print(SEP)
 
     log_file = "logs/demo_verbose.log"
     configure_logging(output_destinations=["stdout", "file"], log_file=log_file, level=logging.DEBUG)
@@ -111,9 +119,9 @@ def demo_verbose_logging():
 
 def demo_custom_configuration():
     """Demo: Custom logging configuration"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO 6: Custom Logging Configuration")
-    print("=" * 60)
+    print(SEP)
 
     # Configure with custom settings
     configure_logging(output_destinations=["stdout", "file"], log_file="logs/custom_demo.log", level=logging.INFO)
@@ -127,20 +135,35 @@ def demo_custom_configuration():
     print(f"📄 Current log file: {current_log_file}")
 
 
+def _write_if_changed(path: str, data: bytes):
+    """Write data to path only if it differs from what is already on disk"""
+    file_path = Path(path)
+    try:
+        existing = file_path.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    if existing != data:
+        file_path.write_bytes(data)
+
+
 def show_log_file_contents(log_file: str):
     """Show the contents of a log file"""
-    if os.path.exists(log_file):
-        print(f"\n📄 Contents of {log_file}:")
-        print("-" * 40)
-        with open(log_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            if content.strip():
-                print(content)
-            else:
-                print("(File is empty)")
-        print("-" * 40)
-    else:
+    # Open once and take the size from the open file instead of separate exists/getsize lookups
+    try:
+        f = Path(log_file).open("r", encoding="utf-8")
+    except FileNotFoundError:
         print(f"❌ Log file not found: {log_file}")
+        return
+
+    with f:
+        print(f"\n📄 Contents of {log_file}:")
+        print(HR)
+        if os.fstat(f.fileno()).st_size == 0:
+            print("(File is empty)")
+        else:
+            # Stream the file instead of loading it into memory
+            shutil.copyfileobj(f, sys.stdout)
+        print(HR)
 
 
 def main():
@@ -152,58 +175,57 @@ def main():
     # Create logs directory
     os.makedirs("logs", exist_ok=True)
 
+    log_files = ["logs/demo_file_only.log", "logs/demo_console_and_file.log", "logs/demo_verbose.log", "logs/custom_demo.log"]
+
+    # Start each run with empty demo logs, leaving already-empty files untouched
+    for log_file in log_files:
+        _write_if_changed(log_file, b"")
+
     # Run all demos
     demo_console_only()
     demo_file_only()
     demo_console_and_file()
     demo_stderr()
 
-    # Import logging for verbose demo
-    import logging
-
     demo_verbose_logging()
     demo_custom_configuration()
 
     # Show some log file contents
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("LOG FILE CONTENTS")
-    print("=" * 60)
-
-    log_files = ["logs/demo_file_only.log", "logs/demo_console_and_file.log", "logs/demo_verbose.log", "logs/custom_demo.log"]
+    print(SEP)
 
     for log_file in log_files:
         show_log_file_contents(log_file)
 
-    print("\n" + "=" * 60)
-    print("📝 SUMMARY OF LOGGING OUTPUT OPTIONS")
-    print("=" * 60)
-
-    print("\n🎯 Available Output Destinations:")
-    print("• stdout (console) - Default, user-friendly messages")
-    print("• stderr (error stream) - For error messages")
-    print("• file - Persistent logging with timestamps")
-    print("• Multiple destinations - Combine any of the above")
-
-    print("\n🔧 Configuration Functions:")
-    print("• log_to_console_only() - Console output only")
-    print("• log_to_file_only(log_file) - File output only")
-    print("• log_to_console_and_file(log_file) - Both console and file")
-    print("• log_to_stderr() - Error stream output")
-    print("• configure_logging() - Custom configuration")
-
-    print("\n📊 Log Levels:")
-    print("• INFO - General information (default)")
-    print("• DEBUG - Detailed debugging information")
-    print("• WARNING - Warning messages")
-    print("• ERROR - Error messages")
-
-    print("\n💡 Use Cases:")
-    print("• Development: Console + file for debugging")
-    print("• Production: File only for persistent logs")
-    print("• Testing: Console only for immediate feedback")
-    print("• Errors: Stderr for error handling")
-
-    print("\n✅ Demo Complete! Check the 'logs' directory for generated log files.")
+    summary = [
+        "\n" + SEP,
+        "📝 SUMMARY OF LOGGING OUTPUT OPTIONS",
+        SEP,
+        "\n🎯 Available Output Destinations:",
+        "• stdout (console) - Default, user-friendly messages",
+        "• stderr (error stream) - For error messages",
+        "• file - Persistent logging with timestamps",
+        "• Multiple destinations - Combine any of the above",
+        "\n🔧 Configuration Functions:",
+        "• log_to_console_only() - Console output only",
+        "• log_to_file_only(log_file) - File output only",
+        "• log_to_console_and_file(log_file) - Both console and file",
+        "• log_to_stderr() - Error stream output",
+        "• configure_logging() - Custom configuration",
+        "\n📊 Log Levels:",
+        "• INFO - General information (default)",
+        "• DEBUG - Detailed debugging information",
+        "• WARNING - Warning messages",
+        "• ERROR - Error messages",
+        "\n💡 Use Cases:",
+        "• Development: Console + file for debugging",
+        "• Production: File only for persistent logs",
+        "• Testing: Console only for immediate feedback",
+        "• Errors: Stderr for error handling",
+        "\n✅ Demo Complete! Check the 'logs' directory for generated log files.",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,41 +3,158 @@
 Demo script showing standard logging directory structure and organization.
 """
 
+import argparse
+import mmap
 import os
+import platform
 import sys
-from dotenv import load_dotenv
+from datetime import datetime
+from pathlib import Path
 
 # Add the src directory to the path so we can import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from visual_layer_sdk.logger import (  # noqa: E402
+    get_default_log_directory,
+    show_log_directory_info,
+    log_to_console_and_file,
+    log_to_file_only,
+    get_logger,
+    configure_logging,
+    get_log_file_path,
+    list_log_files,
+)
+import logging  # noqa: E402
+
+# Banner separators shared by all demos
+SEP = "=" * 60
+HR = "-" * 50
+
+# Platform details are looked up once at import
+_SYSTEM = platform.system()
+_RELEASE = platform.release()
+
+# Log directory description per platform; anything unrecognized is treated as Linux
+_LINUX_INFO = "\n".join(
+    (
+        "\n📁 Linux Log Directory:",
+        "  Default: ~/.local/share/visual-layer/logs/",
+        "  Example: /home/username/.local/share/visual-layer/logs/",
+        "  Files: visual_layer_sdk_YYYY-MM-DD.log",
+    )
+)
+_PLATFORM_INFO = {
+    "Windows": "\n".join(
+        (
+            "\n📁 Windows Log Directory:",
+            "  Default: %APPDATA%/VisualLayer/logs/",
+            "  Example: C:\\Users\\Username\\AppData\\Roaming\\VisualLayer\\logs\\",
+            "  Files: visual_layer_sdk_YYYY-MM-DD.log",
+        )
+    ),
+    "Darwin": "\n".join(
+        (
+            "\n📁 macOS Log Directory:",
+            "  Default: ~/.local/share/visual-layer/logs/",
+            "  Example: /Users/username/.local/share/visual-layer/logs/",
+            "  Files: visual_layer_sdk_YYYY-MM-DD.log",
+        )
+    ),
+    "Linux": _LINUX_INFO,
+}
+
+_CONVENTIONS = """
+💡 Standard Application Logging Conventions:
+  • Daily log files with date stamps
+  • Platform-appropriate directory locations
+  • Automatic directory creation
+  • Timestamped log entries
+  • Log level indicators
+  • UTF-8 encoding for international support
+"""
+
+_SUMMARY = """
+🎯 Standard Log Directory Structure:
+• Platform-appropriate default locations
+• Daily log files with date stamps
+• Automatic directory creation
+• Organized file naming conventions
+
+🔧 Log File Management:
+• List all log files
+• Get latest log file
+• Show log directory information
+• Custom log directory support
+
+💼 Production Features:
+• File-only logging for production
+• Timestamped entries
+• Log level indicators
+• UTF-8 encoding support
+
+🔄 Log File Organization:
+• One file per day
+• Automatic rotation
+• Easy to find and manage
+• Standard naming convention
+
+✅ Demo Complete!
+Check the log directories to see the organized log files.
+"""
+
+
+def _banner(title: str):
+    """Print a section title between separators in a single write"""
+    sys.stdout.write(f"\n{SEP}\n{title}\n{SEP}\n")
 
-from visual_layer_sdk.logger import get_default_log_directory, list_log_files, get_latest_log_file, show_log_directory_info, log_to_console_and_file, log_to_file_only, get_logger, configure_logging
-import logging
 
+def _dump_log(path: str, title: str):
+    """Print a log file by memory-mapping it straight to stdout, without decoding it into a str"""
+    # Push out records still held by the handlers before reading
+    for handler in get_logger().logger.handlers:
+        handler.flush()
 
-def demo_standard_log_directory():
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+
+    with f:
+        print(f"\n📄 {title}:")
+        print(HR)
+        # Empty files can't be mapped; the size comes from the fstat we need anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            print("(File is empty)")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(mm)
+                sys.stdout.buffer.flush()
+        print(HR)
+
+
+def demo_standard_log_directory(quiet: bool = False):
     """Demo: Show standard log directory structure"""
-    print("🚀 Visual Layer SDK - Standard Logging Directory Demo")
-    print("=" * 60)
+    sys.stdout.write(f"🚀 Visual Layer SDK - Standard Logging Directory Demo\n{SEP}\n")
 
     # Show default log directory
     default_log_dir = get_default_log_directory()
     print(f"📁 Default log directory: {default_log_dir}")
 
     # Show current platform
-    import platform
-
-    print(f"🖥️  Platform: {platform.system()} {platform.release()}")
+    print(f"🖥️  Platform: {_SYSTEM} {_RELEASE}")
 
-    # Show log directory info
-    print("\n📊 Log Directory Information:")
-    show_log_directory_info()
+    # Show log directory info; shown even when output is redirected unless --quiet is given
+    if not quiet:
+        print("\n📊 Log Directory Information:")
+        show_log_directory_info(quiet=False)
 
 
 def demo_daily_log_files():
     """Demo: Show how daily log files work"""
-    print("\n" + "=" * 60)
-    print("DEMO: Daily Log File Organization")
-    print("=" * 60)
+    _banner("DEMO: Daily Log File Organization")
 
     # Configure logging to use default directory
     log_to_console_and_file()
@@ -45,73 +162,56 @@ def demo_daily_log_files():
 
     print("📝 Creating some log entries...")
 
-    # Simulate some operations that will be logged
-    logger.info("Starting daily log file demo")
-    logger.success("SDK initialized successfully")
+    # Simulate some operations that will be logged, written out together when the batch ends
+    with logger.batch():
+        logger.info("Starting daily log file demo")
+        logger.success("SDK initialized successfully")
 
-    # Simulate dataset operations
-    logger.dataset_created("demo-123", "Daily Demo Dataset")
-    logger.dataset_uploading("Daily Demo Dataset")
-    logger.dataset_uploaded("Daily Demo Dataset")
+        # Simulate dataset operations
+        logger.dataset_created("demo-123", "Daily Demo Dataset")
+        logger.dataset_uploading("Daily Demo Dataset")
+        logger.dataset_uploaded("Daily Demo Dataset")
 
-    # Simulate search operations
-    logger.search_started("labels", "cat")
-    logger.search_completed(25, "labels", "cat")
+        # Simulate search operations
+        logger.search_started("labels", "cat")
+        logger.search_completed(25, "labels", "cat")
 
     # Show current log file
-    current_log_file = get_logger().logger.handlers[1].baseFilename if len(get_logger().logger.handlers) > 1 else "None"
+    current_log_file = get_log_file_path() or "None"
     print(f"\n✅ Log entries written to: {current_log_file}")
 
     # Show log file contents
-    if os.path.exists(current_log_file):
-        print(f"\n📄 Log file contents:")
-        print("-" * 50)
-        with open(current_log_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            if content.strip():
-                print(content)
-            else:
-                print("(File is empty)")
-        print("-" * 50)
+    _dump_log(current_log_file, "Log file contents")
 
 
 def demo_log_file_management():
     """Demo: Log file management features"""
-    print("\n" + "=" * 60)
-    print("DEMO: Log File Management")
-    print("=" * 60)
-
-    # List all log files
-    log_files = list_log_files()
-    print(f"📄 Found {len(log_files)} log files:")
-
-    for i, log_file in enumerate(log_files[-5:], 1):  # Show last 5
-        file_size = os.path.getsize(log_file)
-        file_time = os.path.getmtime(log_file)
-        from datetime import datetime
-
-        file_time_str = datetime.fromtimestamp(file_time).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"  {i}. {os.path.basename(log_file)}")
-        print(f"     Size: {file_size} bytes")
+    _banner("DEMO: Log File Management")
+
+    # Pick the five newest log files in one directory scan, without sorting the whole directory
+    log_files = list_log_files(limit=5, newest_first=True)
+    print(f"📄 Showing the {len(log_files)} most recent log files:")
+
+    for i, log_path in enumerate(map(Path, log_files), 1):
+        stat_result = log_path.stat()
+        file_time_str = datetime.fromtimestamp(stat_result.st_mtime).isoformat(sep=" ", timespec="seconds")
+        print(f"  {i}. {log_path.name}")
+        print(f"     Size: {stat_result.st_size} bytes")
         print(f"     Modified: {file_time_str}")
 
-    # Get latest log file
-    latest_log = get_latest_log_file()
-    if latest_log:
-        print(f"\n🔄 Most recent log file: {os.path.basename(latest_log)}")
+    if log_files:
+        print(f"\n🔄 Most recent log file: {Path(log_files[0]).name}")
     else:
         print("\n🔄 No log files found")
 
 
 def demo_custom_log_directory():
     """Demo: Using custom log directory"""
-    print("\n" + "=" * 60)
-    print("DEMO: Custom Log Directory")
-    print("=" * 60)
+    _banner("DEMO: Custom Log Directory")
 
     # Create custom log directory
     custom_log_dir = "custom_logs"
-    custom_log_file = os.path.join(custom_log_dir, "custom_app.log")
+    custom_log_file = Path(custom_log_dir) / "custom_app.log"
 
     print(f"📁 Using custom log directory: {custom_log_dir}")
 
@@ -125,33 +225,24 @@ def demo_custom_log_directory():
     print(f"✅ Custom log file created: {custom_log_file}")
 
     # Show custom log file contents
-    if os.path.exists(custom_log_file):
-        print(f"\n📄 Custom log file contents:")
-        print("-" * 50)
-        with open(custom_log_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            if content.strip():
-                print(content)
-            else:
-                print("(File is empty)")
-        print("-" * 50)
+    _dump_log(custom_log_file, "Custom log file contents")
 
 
 def demo_production_logging():
     """Demo: Production-style logging"""
-    print("\n" + "=" * 60)
-    print("DEMO: Production Logging Setup")
-    print("=" * 60)
+    _banner("DEMO: Production Logging Setup")
 
     # Configure for production (file only, no console output)
     production_log_dir = "production_logs"
-    production_log_file = os.path.join(production_log_dir, "production.log")
+    production_log_file = Path(production_log_dir) / "production.log"
 
     print(f"🏭 Configuring production logging...")
     print(f"📁 Production log directory: {production_log_dir}")
     print(f"📄 Production log file: {production_log_file}")
 
-    log_to_file_only(production_log_file)
+    # Buffer records and write them in batches from a background thread; the buffer is flushed on errors and at exit.
+    # The file rolls over at midnight so a long-running service keeps one log per day
+    log_to_file_only(production_log_file, buffered=True, async_queue=True, rotate_daily=True)
     logger = get_logger()
 
     # Simulate production operations
@@ -174,87 +265,29 @@ def demo_production_logging():
 
 def show_platform_specific_info():
     """Show platform-specific log directory information"""
-    print("\n" + "=" * 60)
-    print("PLATFORM-SPECIFIC LOG DIRECTORY INFORMATION")
-    print("=" * 60)
-
-    import platform
-
-    system = platform.system()
-
-    print(f"🖥️  Operating System: {system}")
-
-    if system == "Windows":
-        print("\n📁 Windows Log Directory:")
-        print("  Default: %APPDATA%/VisualLayer/logs/")
-        print("  Example: C:\\Users\\Username\\AppData\\Roaming\\VisualLayer\\logs\\")
-        print("  Files: visual_layer_sdk_YYYY-MM-DD.log")
-
-    elif system == "Darwin":  # macOS
-        print("\n📁 macOS Log Directory:")
-        print("  Default: ~/.local/share/visual-layer/logs/")
-        print("  Example: /Users/username/.local/share/visual-layer/logs/")
-        print("  Files: visual_layer_sdk_YYYY-MM-DD.log")
-
-    else:  # Linux
-        print("\n📁 Linux Log Directory:")
-        print("  Default: ~/.local/share/visual-layer/logs/")
-        print("  Example: /home/username/.local/share/visual-layer/logs/")
-        print("  Files: visual_layer_sdk_YYYY-MM-DD.log")
-
-    print("\n💡 Standard Application Logging Conventions:")
-    print("  • Daily log files with date stamps")
-    print("  • Platform-appropriate directory locations")
-    print("  • Automatic directory creation")
-    print("  • Timestamped log entries")
-    print("  • Log level indicators")
-    print("  • UTF-8 encoding for international support")
+    _banner("PLATFORM-SPECIFIC LOG DIRECTORY INFORMATION")
+    sys.stdout.write(f"🖥️  Operating System: {_SYSTEM}\n{_PLATFORM_INFO.get(_SYSTEM, _LINUX_INFO)}\n{_CONVENTIONS}")
 
 
 def main():
     """Run all standard logging demos"""
+    parser = argparse.ArgumentParser(description="Visual Layer SDK standard logging directory demo")
+    parser.add_argument("--quiet", action="store_true", help="Skip scanning the log directory")
+    args = parser.parse_args()
 
     print("🚀 Visual Layer SDK - Standard Logging Directory Demo")
     print("This demo shows how logs are organized following standard conventions")
 
     # Run all demos
-    demo_standard_log_directory()
+    demo_standard_log_directory(quiet=args.quiet)
     demo_daily_log_files()
     demo_log_file_management()
     demo_custom_log_directory()
     demo_production_logging()
     show_platform_specific_info()
 
-    print("\n" + "=" * 60)
-    print("📝 SUMMARY OF STANDARD LOGGING FEATURES")
-    print("=" * 60)
-
-    print("\n🎯 Standard Log Directory Structure:")
-    print("• Platform-appropriate default locations")
-    print("• Daily log files with date stamps")
-    print("• Automatic directory creation")
-    print("• Organized file naming conventions")
-
-    print("\n🔧 Log File Management:")
-    print("• List all log files")
-    print("• Get latest log file")
-    print("• Show log directory information")
-    print("• Custom log directory support")
-
-    print("\n💼 Production Features:")
-    print("• File-only logging for production")
-    print("• Timestamped entries")
-    print("• Log level indicators")
-    print("• UTF-8 encoding support")
-
-    print("\n🔄 Log File Organization:")
-    print("• One file per day")
-    print("• Automatic rotation")
-    print("• Easy to find and manage")
-    print("• Standard naming convention")
-
-    print("\n✅ Demo Complete!")
-    print("Check the log directories to see the organized log files.")
+    _banner("📝 SUMMARY OF STANDARD LOGGING FEATURES")
+    sys.stdout.write(_SUMMARY)
 
 
 if __name__ == "__main__":
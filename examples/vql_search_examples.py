@@ -6,20 +6,32 @@ This shows both the existing VQL methods and the new VQL methods for labels and
 
 import os
 import sys
+import traceback
 from dotenv import load_dotenv
 
 # Add the src directory to the path so we can import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from visual_layer_sdk.client import VisualLayerClient
-from visual_layer_sdk.dataset import Dataset
+from visual_layer_sdk.client import VisualLayerClient  # noqa: E402
+from visual_layer_sdk.dataset import Dataset  # noqa: E402
+
+# Banner separators shared by all demos
+SEP = "=" * 60
+
+# Example VQL payloads shown by demo_advanced_vql_queries, built once at import
+ISSUE_VQL = [{"issues": {"op": "issue", "value": "blur", "confidence_min": 0.8, "confidence_max": 1.0, "mode": "in"}}]
+SIMILARITY_VQL = [{"similarity": {"op": "upload", "value": "media_id_123", "threshold": 0.5}}]
+LABEL_VQL = [{"labels": {"op": "in", "value": ["cat", "dog"]}}]
+CAPTION_VQL = [{"captions": {"op": "contains", "value": "cat sitting"}}]
 
 
 def demo_vql_issue_search(client, dataset_id):
     """Demo: Search by issues using VQL (already implemented)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: VQL Issue Search")
-    print("=" * 60)
+    print(SEP)
 
     dataset = Dataset(client, dataset_id)
 
@@ -46,9 +58,9 @@ def demo_vql_issue_search(client, dataset_id):
 
 def demo_vql_visual_similarity_search(client, dataset_id):
     """Demo: Search by visual similarity using VQL (already implemented)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: VQL Visual Similarity Search")
-    print("=" * 60)
+    print(SEP)
 
     dataset = Dataset(client, dataset_id)
 
@@ -71,9 +83,9 @@ def demo_vql_visual_similarity_search(client, dataset_id):
 
 def demo_vql_label_search(client, dataset_id):
     """Demo: Search by labels using VQL (new implementation)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: VQL Label Search")
-    print("=" * 60)
+    print(SEP)
 
     dataset = Dataset(client, dataset_id)
 
@@ -110,9 +122,9 @@ def demo_vql_label_search(client, dataset_id):
 
 def demo_vql_caption_search(client, dataset_id):
     """Demo: Search by captions using VQL (new implementation)"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: VQL Caption Search")
-    print("=" * 60)
+    print(SEP)
 
     dataset = Dataset(client, dataset_id)
 
@@ -149,9 +161,9 @@ def demo_vql_caption_search(client, dataset_id):
 
 def demo_advanced_vql_queries(client, dataset_id):
     """Demo: Advanced VQL query examples"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: Advanced VQL Queries")
-    print("=" * 60)
+    print(SEP)
 
     dataset = Dataset(client, dataset_id)
 
@@ -161,30 +173,26 @@ def demo_advanced_vql_queries(client, dataset_id):
 
     # Example 1: Issue search VQL structure
     print("\n📋 Example 1: Issue Search VQL Structure")
-    issue_vql = [{"issues": {"op": "issue", "value": "blur", "confidence_min": 0.8, "confidence_max": 1.0, "mode": "in"}}]
-    print(f"VQL for blur issues: {issue_vql}")
+    print(f"VQL for blur issues: {ISSUE_VQL}")
 
     # Example 2: Visual similarity VQL structure
     print("\n📋 Example 2: Visual Similarity VQL Structure")
-    similarity_vql = [{"similarity": {"op": "upload", "value": "media_id_123", "threshold": 0.5}}]
-    print(f"VQL for visual similarity: {similarity_vql}")
+    print(f"VQL for visual similarity: {SIMILARITY_VQL}")
 
     # Example 3: Label search VQL structure
     print("\n📋 Example 3: Label Search VQL Structure")
-    label_vql = [{"labels": {"op": "in", "value": ["cat", "dog"]}}]
-    print(f"VQL for label search: {label_vql}")
+    print(f"VQL for label search: {LABEL_VQL}")
 
     # Example 4: Caption search VQL structure
     print("\n📋 Example 4: Caption Search VQL Structure")
-    caption_vql = [{"captions": {"op": "contains", "value": "cat sitting"}}]
-    print(f"VQL for caption search: {caption_vql}")
+    print(f"VQL for caption search: {CAPTION_VQL}")
 
 
 def demo_vql_parameter_comparison():
     """Demo: Compare VQL vs non-VQL parameters"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("DEMO: VQL vs Non-VQL Parameter Comparison")
-    print("=" * 60)
+    print(SEP)
 
     print("📊 Parameter Comparison:")
     print("\n🔍 Label Search:")
@@ -245,13 +253,11 @@ def main():
 
     except Exception as e:
         print(f"❌ Error during demo: {str(e)}")
-        import traceback
-
         print(f"Full error: {traceback.format_exc()}")
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("📝 SUMMARY OF VQL SEARCH FEATURES")
-    print("=" * 60)
+    print(SEP)
 
     print("\n🎯 VQL Search Methods:")
     print("• search_by_issues_to_dataframe() - Issue search using VQL")
@@ -12,6 +12,9 @@ setup(
         "pandas>=2.2.0",
         "typeguard",
     ],
+    extras_require={
+        "fast": ["orjson>=3", "brotli", "urllib3[zstd]>=2", "ijson>=3.1"],
+    },
     author="Jack Zhangr",
     author_email="jack@visuallayer.com",
     description="Python SDK for Visual Layer API",
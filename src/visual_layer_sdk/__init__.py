@@ -4,9 +4,7 @@ Visual Layer SDK
 A Python SDK for interacting with the Visual Layer API.
 """
 
-from .client import VisualLayerClient
-from .dataset import Dataset, IssueType, SearchOperator
-from .exceptions import VisualLayerException
+import importlib
 
 __version__ = "0.1.25"
 __all__ = [
@@ -16,3 +14,26 @@ __all__ = [
     "IssueType",
     "VisualLayerException",
 ]
+
+# Public names are resolved from their submodules on first access (PEP 562),
+# so importing the package does not pull in requests/pandas until needed.
+_LAZY_IMPORTS = {
+    "VisualLayerClient": ".client",
+    "Dataset": ".dataset",
+    "SearchOperator": ".dataset",
+    "IssueType": ".dataset",
+    "VisualLayerException": ".exceptions",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,225 @@
+import asyncio
+import base64
+import hmac
+import io
+import json
+import logging
+import mmap
 import os
-from datetime import datetime, timedelta, timezone
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Mapping
+from urllib.parse import urlencode
 
-import jwt
 import pandas as pd
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from .dataset import Dataset, SearchOperator
 from .logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
+
+def _response_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _MultipartUpload:
+    """
+    multipart/form-data body that streams the file from disk as it is sent.
+
+    requests buffers files= uploads in memory; this file-like body reports its length up front
+    (so Content-Length is set) and reads the file in the chunks the connection asks for.
+    """
+
+    def __init__(self, fields: dict, file_field: str, filename: str, file_obj, file_content_type: str):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        quoted_filename = filename.replace('"', "%22")
+        head = "".join(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n' for name, value in fields.items())
+        head += f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{quoted_filename}"\r\nContent-Type: {file_content_type}\r\n\r\n'
+        head = head.encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        file_size = len(file_obj) if isinstance(file_obj, mmap.mmap) else os.fstat(file_obj.fileno()).st_size
+        self._length = len(head) + file_size + len(tail)
+        self._parts = [io.BytesIO(head), file_obj, io.BytesIO(tail)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+
+def _map_file(file):
+    """
+    Read-only mmap of an open file, or the file itself when it is empty (zero-length files cannot be mapped).
+
+    Where supported, the kernel is asked to start reading the whole file into the page cache in the background.
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        return file
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        try:
+            mapped.madvise(mmap.MADV_WILLNEED)
+        except OSError:
+            pass  # only a read-ahead hint
+    return mapped
+
+
+# Dataset fields returned by get_all_datasets and get_dataset_details_as_dataframe, in column order
+_DATASET_FIELDS = (
+    "id",
+    "created_by",
+    "source_dataset_id",
+    "owned_by",
+    "display_name",
+    "description",
+    "preview_uri",
+    "source_type",
+    "source_uri",
+    "created_at",
+    "updated_at",
+    "filename",
+    "sample",
+    "status",
+    "n_images",
+)
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after they are stored"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_BOOLEAN_STRINGS = {"true": True, "false": False}
+
+
+def _dataset_frame(records: list) -> pd.DataFrame:
+    """
+    Project raw dataset records onto _DATASET_FIELDS.
+
+    Timestamps become real UTC datetime columns, n_images a nullable integer and sample a nullable boolean,
+    instead of inferred object columns.
+    """
+    if len(records) == 1:
+        # Single detail lookups: a dict of one-element columns skips from_records' row assembly
+        record = records[0]
+        df = pd.DataFrame({field: [record.get(field)] for field in _DATASET_FIELDS})
+    else:
+        df = pd.DataFrame.from_records(records, columns=_DATASET_FIELDS)
+    for column in ("created_at", "updated_at"):
+        df[column] = pd.to_datetime(df[column], utc=True, format="ISO8601", errors="coerce")
+    df["n_images"] = pd.to_numeric(df["n_images"], errors="coerce").astype("Int64")
+    # JSON booleans as-is; "true"/"false" strings are accepted too, anything else becomes <NA>
+    df["sample"] = df["sample"].map(lambda value: _BOOLEAN_STRINGS.get(value.lower()) if isinstance(value, str) else value).astype("boolean")
+    return df
+
+
+# Connections kept per host; concurrent helpers never run more worker threads than this
+_POOL_MAXSIZE = 64
+
+# Uploads bound the connect phase but never time out while a large zip is still streaming
+_UPLOAD_TIMEOUT = (5, None)
+
+# Retry rate limiting and transient server errors on idempotent requests (honouring Retry-After);
+# POSTs create datasets and are never replayed
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}), raise_on_status=False)
+
+# Set once the SDK logger has been quieted by the first client
+_LOGGING_CONFIGURED = False
+
+
+def _quiet_sdk_logging():
+    """Limit SDK logging to warnings and errors, once per process rather than per client"""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    sdk_logger = logging.getLogger("visual_layer_sdk")
+    sdk_logger.setLevel(logging.WARNING)
+    for handler in sdk_logger.handlers:
+        handler.setLevel(logging.WARNING)
+    _LOGGING_CONFIGURED = True
+
+
+# Dataset metadata responses are reused for this long (seconds) unless refresh=True is passed
+_DATASET_CACHE_TTL = 60
+_DATASET_CACHE_SIZE = 256
+_ALL_DATASETS_KEY = "datasets"
+
+# Headers sent with every JSON request; copied into each JWT header dict, shared as-is otherwise
+_STATIC_HEADERS = MappingProxyType({"accept": "application/json", "Content-Type": "application/json"})
+# Same, for the url-encoded dataset creation forms
+_FORM_HEADERS = MappingProxyType({**_STATIC_HEADERS, "Content-Type": "application/x-www-form-urlencoded"})
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding used by JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _compact_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Lifetime of generated JWTs, and how long before expiry a cached token is replaced (seconds)
+_JWT_LIFETIME = 10 * 60
+_JWT_REFRESH_MARGIN = 30
+
 
 class VisualLayerClient:
     def __init__(self, api_key: str, api_secret: str, url: str = "https://app.visual-layer.com/api/v1"):
@@ -23,14 +234,31 @@ class VisualLayerClient:
         self.base_url = url
         self.api_key = api_key
         self.api_secret = api_secret
+        # Signed JWT reused across requests until shortly before it expires
+        self._jwt_lock = threading.Lock()
+        self._jwt_token = None
+        self._jwt_exp = 0
+        # Read-only request headers for the current token, rebuilt only when the token rotates
+        self._headers = None
+        # The JWT header and HMAC key never change for a client, so encode them once;
+        # the header is stored with its trailing "." so signing only appends the payload
+        self._jwt_signing_prefix = _b64url(_compact_json({"alg": "HS256", "typ": "JWT", "kid": api_key})) + b"."
+        self._secret_bytes = api_secret.encode("utf-8")
+        # Payload JSON up to the iat value; only the two timestamps are filled in per token
+        self._jwt_payload_prefix = _compact_json({"sub": api_key})[:-1] + b',"iat":'
+        # Raw dataset records from recent metadata requests, keyed by dataset id (and _ALL_DATASETS_KEY for the listing)
+        self._dataset_cache = _TTLCache(_DATASET_CACHE_SIZE, _DATASET_CACHE_TTL)
+        # Keep-alive connection pool shared by this client and every Dataset created from it
         self.session = requests.Session()
+        self.session.headers["accept"] = "application/json"
+        # Advertise every compression urllib3 can decode here: gzip/deflate, plus br and zstd when their decoders
+        # (the "fast" extra) are installed. Dataset requests, including exports, go through this session too
+        self.session.headers.update(make_headers(accept_encoding=True))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.logger = get_logger()
-        import logging
-
-        sdk_logger = logging.getLogger("visual_layer_sdk")
-        sdk_logger.setLevel(logging.WARNING)
-        for handler in sdk_logger.handlers:
-            handler.setLevel(logging.WARNING)
+        _quiet_sdk_logging()
 
         # Run healthcheck to validate the URL
         try:
@@ -41,117 +269,144 @@ class VisualLayerClient:
             raise ValueError(f"Invalid URL: {url}")
 
     def _generate_jwt(self) -> str:
-        jwt_algorithm = "HS256"
-        jwt_header = {
-            "alg": jwt_algorithm,
-            "typ": "JWT",
-            "kid": self.api_key,
-        }
+        # Lock-free fast path: the token and its headers are always stored before its expiry,
+        # so an unexpired _jwt_exp never pairs with a stale token
+        if time.time() < self._jwt_exp - _JWT_REFRESH_MARGIN:
+            return self._jwt_token
+
+        with self._jwt_lock:
+            if self._jwt_token is not None and time.time() < self._jwt_exp - _JWT_REFRESH_MARGIN:
+                return self._jwt_token
+
+            token, exp = self._encode_jwt()
+            self._jwt_token = token
+            self._headers = MappingProxyType({"Authorization": f"Bearer {token}", **_STATIC_HEADERS})
+            self._jwt_exp = exp
+            return token
+
+    def _encode_jwt(self) -> tuple:
+        """Sign a new HS256 JWT, returning it with its expiry timestamp"""
+        now = int(time.time())
+        exp = now + _JWT_LIFETIME
+        payload_b64 = _b64url(self._jwt_payload_prefix + b'%d,"exp":%d,"iss":"sdk"}' % (now, exp))
+        signing_input = self._jwt_signing_prefix + payload_b64
+        # One-shot HMAC runs entirely inside OpenSSL without building an hmac.HMAC object
+        signature = _b64url(hmac.digest(self._secret_bytes, signing_input, "sha256"))
+        return (signing_input + b"." + signature).decode("ascii"), exp
+
+    def _get_headers(self) -> Mapping[str, str]:
+        # Shared and read-only; callers needing different headers build their own dict from it
+        self._generate_jwt()
+        return self._headers
+
+    def _get_headers_no_jwt(self) -> Mapping[str, str]:
+        # Read-only and shared: requests copies request headers while merging them with the session's
+        return _STATIC_HEADERS
 
-        now = datetime.now(tz=timezone.utc)
-        expiration = now + timedelta(minutes=10)
+    def healthcheck(self) -> dict:
+        """Check the health of the API"""
+        response = self.session.get(f"{self.base_url}/healthcheck", headers=self._get_headers())
+        # Checking the status inline keeps the success path to a single comparison
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return _response_json(response)
 
-        payload = {
-            "sub": self.api_key,
-            "iat": int(now.timestamp()),
-            "exp": int(expiration.timestamp()),
-            "iss": "sdk",
-        }
+    def get_all_datasets(self, refresh: bool = False) -> pd.DataFrame:
+        """
+        Get all datasets as a DataFrame.
 
-        return jwt.encode(
-            payload=payload,
-            key=self.api_secret,
-            algorithm=jwt_algorithm,
-            headers=jwt_header,
-        )
-
-    def _get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self._generate_jwt()}",
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        The listing is cached for 60 seconds; pass refresh=True to fetch it again.
+        """
+        datasets = None if refresh else self._dataset_cache.get(_ALL_DATASETS_KEY)
+        if datasets is None:
+            response = self.session.get(f"{self.base_url}/datasets", headers=self._get_headers())
+            if response.status_code >= 400:
+                response.raise_for_status()
+            datasets = _response_json(response)
+            self._dataset_cache.set(_ALL_DATASETS_KEY, datasets)
 
-    def _get_headers_no_jwt(self) -> dict:
-        return {"accept": "application/json", "Content-Type": "application/json"}
+        return _dataset_frame(datasets)
 
-    def healthcheck(self) -> dict:
-        """Check the health of the API"""
-        response = self.session.get(f"{self.base_url}/healthcheck", headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
-
-    def get_all_datasets(self) -> pd.DataFrame:
-        """Get all datasets as a DataFrame"""
-        response = self.session.get(f"{self.base_url}/datasets", headers=self._get_headers())
-        response.raise_for_status()
-        datasets = response.json()
-
-        # Select only the specific fields for each dataset
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-            "n_images",
-        ]
-
-        # Filter each dataset to only include the selected fields
-        filtered_datasets = []
-        for dataset in datasets:
-            filtered_dataset = {field: dataset.get(field) for field in selected_fields}
-            filtered_datasets.append(filtered_dataset)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(filtered_datasets)
-        return df
-
-    def get_dataset(self, dataset_id: str) -> pd.DataFrame:
+    def get_dataset(self, dataset_id: str, refresh: bool = False) -> pd.DataFrame:
         """Get dataset details as a DataFrame for the given ID"""
-        return self.get_dataset_details_as_dataframe(dataset_id)
+        return self.get_dataset_details_as_dataframe(dataset_id, refresh=refresh)
+
+    # Async variants run the blocking call in a worker thread on the shared session, so calls
+    # awaited together overlap their round-trips while reusing pooled connections and the cached JWT
+    async def aget_all_datasets(self) -> pd.DataFrame:
+        """Async variant of get_all_datasets"""
+        return await asyncio.to_thread(self.get_all_datasets)
+
+    async def aget_dataset(self, dataset_id: str) -> pd.DataFrame:
+        """Async variant of get_dataset"""
+        return await asyncio.to_thread(self.get_dataset_details_as_dataframe, dataset_id)
+
+    async def bulk_get_datasets(self, dataset_ids: List[str]) -> pd.DataFrame:
+        """
+        Async variant of get_datasets_details: details for several datasets, fetched concurrently.
+
+        Args:
+            dataset_ids (List[str]): IDs of the datasets to fetch
+
+        Returns:
+            pd.DataFrame: One row per dataset, in the order of dataset_ids
+
+        Examples:
+            >>> df = asyncio.run(client.bulk_get_datasets(["id-1", "id-2"]))
+        """
+        # The fan-out itself runs on get_datasets_details' thread pool, sized to the session's connection pool
+        return await asyncio.to_thread(self.get_datasets_details, dataset_ids)
+
+    def get_dataset_details(self, dataset_id: str, refresh: bool = False) -> dict:
+        """
+        Get dataset details as a dict of the _DATASET_FIELDS for the given ID.
+
+        Cheaper than get_dataset_details_as_dataframe when a single record is all that is needed.
+        Details are cached for 60 seconds; pass refresh=True to fetch them again.
+        """
+        dataset_details = self._get_dataset_raw(dataset_id, refresh=refresh)
+        return {field: dataset_details.get(field) for field in _DATASET_FIELDS}
 
     # TODO: move to dataset.py
-    def get_dataset_details_as_dataframe(self, dataset_id: str) -> pd.DataFrame:
-        """Get dataset details as a DataFrame for the given ID"""
-        response = self.session.get(f"{self.base_url}/dataset/{dataset_id}", headers=self._get_headers())
-        response.raise_for_status()
-        dataset_details = response.json()
-
-        # Select only the specific fields requested
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-            "n_images",
-        ]
-
-        # Filter the dataset details to only include the selected fields
-        filtered_details = {field: dataset_details.get(field) for field in selected_fields}
-
-        # Convert to DataFrame with a single row
-        df = pd.DataFrame([filtered_details])
-        return df
+    def get_dataset_details_as_dataframe(self, dataset_id: str, refresh: bool = False) -> pd.DataFrame:
+        """
+        Get dataset details as a DataFrame for the given ID.
+
+        Details are cached for 60 seconds; pass refresh=True to fetch them again.
+        """
+        # Convert to DataFrame with a single row of the selected fields
+        return _dataset_frame([self._get_dataset_raw(dataset_id, refresh=refresh)])
+
+    def get_datasets_details(self, dataset_ids: List[str], max_workers: int = 16) -> pd.DataFrame:
+        """
+        Get details for several datasets using a pool of threads over the shared session.
+
+        Args:
+            dataset_ids (List[str]): IDs of the datasets to fetch
+            max_workers (int): Number of concurrent requests, capped at the connection pool size
+
+        Returns:
+            pd.DataFrame: One row per dataset, in the order of dataset_ids
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, _POOL_MAXSIZE))) as executor:
+            records = list(executor.map(self._get_dataset_raw, dataset_ids))
+        return _dataset_frame(records)
+
+    def _invalidate_dataset(self, dataset_id: str):
+        """Drop a dataset's cached record and the cached listing, e.g. after it was deleted"""
+        self._dataset_cache.pop(dataset_id)
+        self._dataset_cache.pop(_ALL_DATASETS_KEY)
+
+    def _get_dataset_raw(self, dataset_id: str, refresh: bool = False) -> dict:
+        """Return the raw /dataset/{id} record, from the cache when it is still fresh"""
+        dataset_details = None if refresh else self._dataset_cache.get(dataset_id)
+        if dataset_details is None:
+            response = self.session.get(f"{self.base_url}/dataset/{dataset_id}", headers=self._get_headers())
+            if response.status_code >= 400:
+                response.raise_for_status()
+            dataset_details = _response_json(response)
+            self._dataset_cache.set(dataset_id, dataset_details)
+        return dataset_details
 
     def get_dataset_object(self, dataset_id: str) -> Dataset:
         """Get a dataset object for the given ID (for operations like export, delete, etc.)"""
@@ -190,25 +445,28 @@ class VisualLayerClient:
         }
 
         try:
-            headers = self._get_headers()
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            headers = {"Authorization": f"Bearer {self._generate_jwt()}", **_FORM_HEADERS}
+            # Encode the form once up front; requests sends bytes as-is instead of re-encoding the dict
+            body = urlencode(form_data).encode("utf-8")
 
             self.logger.request_details(url, "POST")
-            self.logger.debug(f"Form Data: {form_data}")
+            self.logger.debug("Form Data: %s", form_data)
 
             self.logger.info(f"Creating dataset '{dataset_name}' from S3 bucket...")
             response = self.session.post(
                 url,
-                data=form_data,  # Use data parameter for form data
+                data=body,
                 headers=headers,
                 timeout=30,  # Increased timeout for processing
             )
 
             self.logger.request_success(response.status_code)
-            self.logger.debug(f"Response Body: {response.text}")
+            # response.text decodes the whole body a second time, so only build it when debug output is on
+            if self.logger.debug_enabled():
+                self.logger.debug("Response Body: %s", response.text)
 
             response.raise_for_status()
-            result = response.json()
+            result = _response_json(response)
 
             if result.get("status") == "error":
                 raise requests.exceptions.RequestException(result.get("message", "Unknown error"))
@@ -219,6 +477,8 @@ class VisualLayerClient:
                 raise requests.exceptions.RequestException("No dataset_id returned from creation")
 
             self.logger.dataset_created(dataset_id, dataset_name)
+            # The cached listing no longer includes every dataset
+            self._dataset_cache.pop(_ALL_DATASETS_KEY)
             return Dataset(self, dataset_id)
 
         except requests.exceptions.Timeout:
@@ -226,18 +486,35 @@ class VisualLayerClient:
         except requests.exceptions.RequestException as e:
             if hasattr(e, "response") and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = _response_json(e.response)
                     raise requests.exceptions.RequestException(error_data.get("message", str(e)))
                 except ValueError:
                     pass
             raise
 
+    async def bulk_create_datasets_from_s3(self, items: List[dict]) -> List[Dataset]:
+        """
+        Create several datasets from S3 buckets concurrently over the shared session.
+
+        Args:
+            items (List[dict]): Keyword arguments for create_dataset_from_s3_bucket, one dict per dataset
+                (s3_bucket_path, dataset_name and optionally pipeline_type)
+
+        Returns:
+            List[Dataset]: The created datasets, in the order of items
+
+        Examples:
+            >>> datasets = asyncio.run(client.bulk_create_datasets_from_s3([{"s3_bucket_path": "s3://bucket/a", "dataset_name": "a"}]))
+        """
+        return list(await asyncio.gather(*(asyncio.to_thread(self.create_dataset_from_s3_bucket, **item) for item in items)))
+
     def create_dataset_from_local_folder(
         self,
         file_path: str,
         filename: str,
         dataset_name: str,
         pipeline_type: str = None,
+        use_multipart: bool = True,
     ) -> Dataset:
         """
         Create a dataset from a local zip file.
@@ -247,6 +524,8 @@ class VisualLayerClient:
             filename (str): Name of the zip file (e.g., "images.zip")
             dataset_name (str): The desired name of the dataset
             pipeline_type (str, optional): Type of pipeline to use for processing
+            use_multipart (bool): Upload as multipart/form-data (default). When False the zip is sent
+                as a raw application/zip body, with operations passed in the query string
 
         Returns:
             Dataset: Dataset object for the created dataset
@@ -258,9 +537,21 @@ class VisualLayerClient:
         if not file_path or not filename or not dataset_name:
             raise ValueError("file_path, filename, and dataset_name are all required")
 
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Open the zip before creating the dataset: this is the existence check, and the same
+        # handle is streamed in step 2 so the file is not looked up again
+        try:
+            file = open(file_path, "rb")
+        except FileNotFoundError:
             raise ValueError(f"File not found: {file_path}")
+        except OSError:
+            # A directory, missing permissions, ...
+            raise ValueError(f"Cannot read file: {file_path}")
+        # Map the zip now so the kernel reads it ahead while the create request is in flight
+        try:
+            source = _map_file(file)
+        except (OSError, ValueError):
+            # Not mappable (e.g. a pipe, or a filesystem without mmap support): stream the plain file instead
+            source = file
 
         # Step 1: Create the dataset
         url = f"{self.base_url}/dataset"
@@ -276,18 +567,19 @@ class VisualLayerClient:
         }
 
         try:
-            headers = self._get_headers()
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            # One Authorization value serves both the create and the upload request
+            authorization = f"Bearer {self._generate_jwt()}"
+            headers = {"Authorization": authorization, **_FORM_HEADERS}
 
             self.logger.info(f"Creating dataset '{dataset_name}'...")
             self.logger.request_details(url, "POST")
-            self.logger.debug(f"Form Data: {form_data}")
+            self.logger.debug("Form Data: %s", form_data)
 
-            response = self.session.post(url, data=form_data, headers=headers)
+            response = self.session.post(url, data=urlencode(form_data).encode("utf-8"), headers=headers)
 
             self.logger.request_success(response.status_code)
             response.raise_for_status()
-            result = response.json()
+            result = _response_json(response)
 
             if result.get("status") == "error":
                 raise requests.exceptions.RequestException(result.get("message", "Unknown error"))
@@ -297,57 +589,71 @@ class VisualLayerClient:
                 raise requests.exceptions.RequestException("No dataset_id returned from creation")
 
             self.logger.dataset_created(dataset_id, dataset_name)
+            # The cached listing no longer includes every dataset
+            self._dataset_cache.pop(_ALL_DATASETS_KEY)
 
             # Step 2: Upload the zip file to the dataset
             upload_url = f"{self.base_url}/dataset/{dataset_id}/upload"
 
             self.logger.dataset_uploading(dataset_name)
             self.logger.request_details(upload_url, "POST")
-            self.logger.debug(f"File path: {file_path}")
-            self.logger.debug(f"Filename: {filename}")
-
-            # Prepare multipart form data for file upload
-            with open(file_path, "rb") as file:
-                files = {"file": (filename, file, "application/zip")}
-                data = {"operations": "READ"}
-
-                upload_headers = self._get_headers()
-                # Remove Content-Type header to let requests set it for multipart
-                upload_headers.pop("Content-Type", None)
-
-                upload_response = self.session.post(
-                    upload_url,
-                    files=files,
-                    data=data,
-                    headers=upload_headers,
-                )
+            self.logger.debug("File path: %s", file_path)
+            self.logger.debug("Filename: %s", filename)
+
+            # Stream the body from disk instead of building it in memory. Chunks are copied out of the
+            # mapping rather than costing a read() syscall each
+            if use_multipart:
+                body = _MultipartUpload({"operations": "READ"}, "file", filename, source, "application/zip")
+                upload_headers = {"Authorization": authorization, "Content-Type": body.content_type}
+                params = None
+            else:
+                # Raw zip body: no multipart framing, requests sends the mapped file directly
+                body = source
+                quoted_filename = filename.replace('"', "%22")
+                upload_headers = {
+                    "Authorization": authorization,
+                    "Content-Type": "application/zip",
+                    "Content-Disposition": f'attachment; filename="{quoted_filename}"',
+                }
+                params = {"operations": "READ"}
+
+            upload_response = self.session.post(
+                upload_url,
+                data=body,
+                params=params,
+                headers=upload_headers,
+                timeout=_UPLOAD_TIMEOUT,
+            )
 
-                self.logger.request_success(upload_response.status_code)
-                upload_response.raise_for_status()
+            self.logger.request_success(upload_response.status_code)
+            upload_response.raise_for_status()
 
-                self.logger.dataset_uploaded(dataset_name)
+            self.logger.dataset_uploaded(dataset_name)
 
-                # Return Dataset object
-                return Dataset(self, dataset_id)
-                # TODO: return dataset object instead of dict
+            # Return Dataset object
+            return Dataset(self, dataset_id)
+            # TODO: return dataset object instead of dict
         except requests.exceptions.Timeout:
             raise requests.exceptions.RequestException("Request timed out - dataset processing may take longer than expected")
         except requests.exceptions.RequestException as e:
             if hasattr(e, "response") and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = _response_json(e.response)
                     raise requests.exceptions.RequestException(error_data.get("message", str(e)))
                 except ValueError:
                     pass
             raise
-        except FileNotFoundError:
-            raise ValueError(f"Zip file not found: {file_path}")
         except Exception as e:
             raise requests.exceptions.RequestException(f"Unexpected error: {str(e)}")
+        finally:
+            if source is not file:
+                source.close()
+            file.close()
 
 
 def main():
-    import os
+    # Only needed when run as a script, so importing the SDK does not load dotenv
+    from dotenv import load_dotenv
 
     load_dotenv()
 
@@ -1,13 +1,49 @@
+import contextvars
+import functools
 import json
+import random
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from types import MappingProxyType
+from typing import List, Mapping
 
 import pandas as pd
 from typeguard import typechecked
 
 from .logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming parser, installed with the "fast" extra
+    ijson = None
+
+
+# Fields kept by Dataset.get_details, in order
+_DETAIL_FIELDS = (
+    "id",
+    "created_by",
+    "source_dataset_id",
+    "owned_by",
+    "display_name",
+    "description",
+    "preview_uri",
+    "source_type",
+    "source_uri",
+    "created_at",
+    "updated_at",
+    "filename",
+    "sample",
+    "status",
+)
+
 
 class SearchOperator(Enum):
     IS = "is"
@@ -16,6 +52,10 @@ class SearchOperator(Enum):
     IS_NOT_ONE_OF = "not_one_of"
 
 
+# Operator values as accepted in place of SearchOperator members, e.g. search_operator="one_of"
+_SEARCH_OPERATOR_BY_VALUE = {op.value: op for op in SearchOperator}
+
+
 class IssueType(Enum):
     MISLABELS = "mislabels"
     OUTLIERS = "outliers"
@@ -43,7 +83,71 @@ ISSUE_TYPE_MAPPING = {
     6: {"name": "normal", "description": "Normal images", "severity": 0},
     7: {"name": "label_outlier", "description": "Label outliers", "severity": 0},
 }
-ALLOWED_ISSUE_NAMES = {v["name"] for v in ISSUE_TYPE_MAPPING.values()}
+ALLOWED_ISSUE_NAMES = frozenset(v["name"] for v in ISSUE_TYPE_MAPPING.values())
+# Preformatted for error and warning messages
+_ALLOWED_ISSUE_NAMES_STR = ", ".join(sorted(ALLOWED_ISSUE_NAMES))
+
+# Upper bound on sub-searches (each an export plus polling) run at once by the IS_ONE_OF searches
+_MAX_CONCURRENT_SEARCHES = 8
+
+# Seconds that Dataset.get_details (and so get_status, export and str/repr) reuses a fetched response
+_DETAILS_TTL = 2.0
+
+# Seconds that the /user_config response (search capabilities) is reused
+_USER_CONFIG_TTL = 60.0
+
+# Export polling starts this many seconds after the export is created and doubles up to Dataset.poll_interval
+_FIRST_POLL_DELAY = 0.25
+_POLL_JITTER = 0.1
+
+# Set (to a threading.Event) while a search runs only on behalf of another one, such as the positive search
+# in Dataset._all_except; export polling stops early once the event is set because the result is no longer needed
+_search_cancelled = contextvars.ContextVar("search_cancelled", default=None)
+
+
+def _in_caller_context():
+    """Return a runner for zero-argument searches that gives each worker thread a copy of the caller's context"""
+    parent = contextvars.copy_context()
+    return lambda search: parent.copy().run(search)
+
+
+# Memoized parser for VQL passed as a JSON string; results are shared and must not be mutated
+_parse_vql = functools.lru_cache(maxsize=128)(json.loads)
+
+
+def _loads(data: bytes):
+    """Parse JSON straight from bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _check_vql_args(vql, entity_type) -> None:
+    """isinstance checks standing in for @typechecked on the VQL search entry points"""
+    if not isinstance(vql, (list, str)):
+        raise TypeError(f"vql must be a list of dicts or a JSON string, got {type(vql).__name__}")
+    if not isinstance(entity_type, str):
+        raise TypeError(f"entity_type must be a str, got {type(entity_type).__name__}")
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_issue_type(issue_id: int = None, issue_name: str = None) -> Mapping:
+    """Memoized lookup behind Dataset.get_issue_type_info; the result is shared, so it is read-only"""
+    if issue_id is None and issue_name is None:
+        raise ValueError("Either issue_id or issue_name must be provided")
+
+    for type_id, info in ISSUE_TYPE_MAPPING.items():
+        if (issue_id is None or type_id == issue_id) and (issue_name is None or info["name"] == issue_name):
+            return MappingProxyType({"id": type_id, **info})
+
+    raise ValueError(f"Unknown issue type (issue_id={issue_id}, issue_name={issue_name}). Allowed types: {_ALLOWED_ISSUE_NAMES_STR}")
+
+
+def _dump_vql(vql: List[dict]) -> str:
+    """Serialize VQL without whitespace, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(vql).decode()
+    return json.dumps(vql, separators=(",", ":"))
 
 
 class Dataset:
@@ -55,6 +159,10 @@ class Dataset:
         self.logger = get_logger()
         self.poll_interval = poll_interval
         self.timeout = timeout
+        # (time.monotonic() when fetched, details dict) from the last get_details call
+        self._details_cache = None
+        # (time.monotonic() when fetched, config dict) from the last _get_user_config call
+        self._user_config_cache = None
 
         # Validate that the dataset exists
         self._validate_dataset_exists()
@@ -91,6 +199,41 @@ class Dataset:
         """String representation of the dataset with its details"""
         return self.__str__()
 
+    @staticmethod
+    def list_available_issue_types() -> dict:
+        """
+        Get all issue types supported by issue search.
+
+        Returns:
+            dict: Issue type ID mapped to a dict with its name, description and severity
+
+        Examples:
+            for issue_id, info in Dataset.list_available_issue_types().items():
+                print(issue_id, info["name"])
+        """
+        return {issue_id: dict(info) for issue_id, info in ISSUE_TYPE_MAPPING.items()}
+
+    @staticmethod
+    def get_issue_type_info(issue_id: int = None, issue_name: str = None) -> dict:
+        """
+        Get information about a single issue type, looked up by ID or by name.
+
+        Args:
+            issue_id (int, optional): Issue type ID (0-7)
+            issue_name (str, optional): Issue type name (e.g., "blur", "duplicates")
+
+        Returns:
+            dict: The issue type's id, name, description and severity
+
+        Raises:
+            ValueError: If neither argument is given or no issue type matches
+
+        Examples:
+            info = Dataset.get_issue_type_info(issue_id=3)
+            info = Dataset.get_issue_type_info(issue_name="duplicates")
+        """
+        return dict(_lookup_issue_type(issue_id, issue_name))
+
     @typechecked
     def get_stats(self) -> dict:
         """Get statistics for this dataset"""
@@ -103,7 +246,19 @@ class Dataset:
 
     @typechecked
     def get_details(self) -> dict:
-        """Get details for this dataset"""
+        """Get details for this dataset; reused for a couple of seconds so back-to-back status checks share one request"""
+        cached = self._details_cache
+        if cached is not None and time.monotonic() - cached[0] < _DETAILS_TTL:
+            return dict(cached[1])
+        details = self._fetch_details()
+        self._details_cache = (time.monotonic(), details)
+        return dict(details)
+
+    def invalidate_details(self):
+        """Drop cached details so the next get_details or get_status call fetches them again"""
+        self._details_cache = None
+
+    def _fetch_details(self) -> dict:
         response = self.client.session.get(
             f"{self.base_url}/dataset/{self.dataset_id}",
             headers=self.client._get_headers(),
@@ -111,26 +266,8 @@ class Dataset:
         response.raise_for_status()
         full_response = response.json()
 
-        # Filter to only include the specified fields
-        selected_fields = [
-            "id",
-            "created_by",
-            "source_dataset_id",
-            "owned_by",
-            "display_name",
-            "description",
-            "preview_uri",
-            "source_type",
-            "source_uri",
-            "created_at",
-            "updated_at",
-            "filename",
-            "sample",
-            "status",
-        ]
-
         # Create filtered dictionary with only the selected fields
-        filtered_details = {field: full_response.get(field) for field in selected_fields}
+        filtered_details = {field: full_response.get(field) for field in _DETAIL_FIELDS}
 
         # Add search capabilities information
         try:
@@ -178,6 +315,9 @@ class Dataset:
             f"{self.base_url}/dataset/{self.dataset_id}",
             headers=self.client._get_headers(),
         )
+        # Forget this dataset here and in the client's metadata caches, so lookups don't return it as if it still existed
+        self.invalidate_details()
+        self.client._invalidate_dataset(self.dataset_id)
         response.raise_for_status()
         return response.json()
 
@@ -194,6 +334,12 @@ class Dataset:
     @typechecked
     def export(self) -> dict:
         """Export this dataset in JSON format"""
+        response = self._request_export()
+        # Full-dataset exports can be many MB; parse the raw bytes rather than going through response.json()
+        return _loads(response.content)
+
+    def _request_export(self, stream: bool = False):
+        """Check that the dataset can be exported and request its JSON export, returning the (checked) response"""
         # Check if dataset is ready before exporting
         status = self.get_status()
         if status not in ["READY", "completed"]:
@@ -201,19 +347,25 @@ class Dataset:
 
         url = f"{self.base_url}/dataset/{self.dataset_id}/export"
         params = {"export_format": "json"}
-        headers = {**self.client._get_headers()}
-        response = self.client.session.get(url, params=params, headers=headers)
+        response = self.client.session.get(url, params=params, headers=self.client._get_headers(), stream=stream)
         response.raise_for_status()
-        return response.json()
+        return response
 
     @typechecked
-    def export_to_dataframe(self) -> pd.DataFrame:
+    def export_to_dataframe(self, stream: bool = False) -> pd.DataFrame:
         """
         Export this dataset and convert media_items to a DataFrame.
 
+        Args:
+            stream (bool): Parse the export as it downloads, dropping metadata_items item by item, so that neither
+                the raw body nor the whole parsed export is held in memory. Requires ijson (the "fast" extra).
+
         Returns:
             pd.DataFrame: DataFrame containing media_items (excluding metadata_items)
         """
+        if stream and ijson is None:
+            raise ImportError('export_to_dataframe(stream=True) requires ijson; install the "fast" extra')
+
         try:
             # Check if dataset is ready before exporting
             status = self.get_status()
@@ -221,6 +373,15 @@ class Dataset:
                 self.logger.dataset_not_ready(self.dataset_id, status)
                 return pd.DataFrame()
 
+            if stream:
+                media_items = list(self._iter_export_media_items())
+                if not media_items:
+                    self.logger.warning("No media_items found in export data")
+                    return pd.DataFrame()
+                df = pd.DataFrame(media_items)
+                self.logger.export_completed(self.dataset_id, len(df))
+                return df
+
             # Export the dataset
             export_data = self.export()
 
@@ -228,15 +389,9 @@ class Dataset:
             if "media_items" in export_data:
                 media_items = export_data["media_items"]
 
-                # Remove metadata_items from each media item if it exists
-                cleaned_media_items = []
-                for item in media_items:
-                    # Create a copy of the item without metadata_items
-                    cleaned_item = {k: v for k, v in item.items() if k != "metadata_items"}
-                    cleaned_media_items.append(cleaned_item)
-
-                # Convert to DataFrame
-                df = pd.DataFrame(cleaned_media_items)
+                # Convert to DataFrame in one pass and drop the nested metadata_items column, if present,
+                # instead of copying every item into a new dict without it
+                df = pd.DataFrame(media_items).drop(columns=["metadata_items"], errors="ignore")
                 self.logger.export_completed(self.dataset_id, len(df))
                 return df
             else:
@@ -247,6 +402,15 @@ class Dataset:
             self.logger.export_failed(self.dataset_id, str(e))
             return pd.DataFrame()
 
+    def _iter_export_media_items(self):
+        """Stream the JSON export and yield its media_items one at a time, without metadata_items (requires ijson)"""
+        with self._request_export(stream=True) as response:
+            # Let urllib3 undo any gzip/br content encoding while ijson reads the stream
+            response.raw.decode_content = True
+            for item in ijson.items(response.raw, "media_items.item", use_float=True):
+                item.pop("metadata_items", None)
+                yield item
+
     @typechecked
     def get_status(self) -> str:
         return self.get_details()["status"]
@@ -287,11 +451,11 @@ class Dataset:
         if threshold > 0.9:
             self.logger.warning(f"Very high threshold ({threshold}) may cause connection timeouts. Consider using 0.2-0.8 for better performance.")
         if isinstance(search_operator, str):
-            try:
-                search_operator = SearchOperator(search_operator)
-            except ValueError:
+            operator = _SEARCH_OPERATOR_BY_VALUE.get(search_operator)
+            if operator is None:
                 self.logger.warning(f"Invalid search_operator for visual similarity: {search_operator}")
                 return pd.DataFrame()
+            search_operator = operator
         if search_operator == SearchOperator.IS and len(image_path) == 1:
             search_operator = SearchOperator.IS_ONE_OF
         elif search_operator != SearchOperator.IS_ONE_OF:
@@ -299,16 +463,7 @@ class Dataset:
             return pd.DataFrame()
 
         if isinstance(image_path, list):
-            dfs = []
-            for path in image_path:
-                df = self.search_by_visual_similarity(path, entity_type, search_operator, threshold)
-                if df is not None and not df.empty:
-                    dfs.append(df)
-            if dfs:
-                combined = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["media_id"])
-                return combined
-            else:
-                return pd.DataFrame()
+            return self._union_of_searches([functools.partial(self.search_by_visual_similarity, path, entity_type, search_operator, threshold) for path in image_path])
         # Single image path (original behavior)
         # Get media_id from image file upload
         upload_result = self._search_by_image_file(image_path=image_path)
@@ -349,65 +504,22 @@ class Dataset:
             raise ValueError(f"captions must be a list of strings, got {type(captions).__name__}")
 
         if isinstance(search_operator, str):
-            try:
-                search_operator = SearchOperator(search_operator)
-            except ValueError:
+            operator = _SEARCH_OPERATOR_BY_VALUE.get(search_operator)
+            if operator is None:
                 raise ValueError(f"Invalid search_operator for captions: {search_operator}")
+            search_operator = operator
 
         # Handle IS_NOT_ONE_OF operator by getting all images and removing IS_ONE_OF results
         if search_operator == SearchOperator.IS_NOT_ONE_OF:
-            # Get all images in the dataset
-            all_images = self.export_to_dataframe()
-            if all_images.empty:
-                return pd.DataFrame()
-
-            # Get the images that match any of the captions (IS_ONE_OF logic)
-            matching_images = self.search_by_captions(captions, entity_type, SearchOperator.IS_ONE_OF)
-
-            # Remove matching images from all images
-            if not matching_images.empty:
-                result = all_images[~all_images["media_id"].isin(matching_images["media_id"])]
-            else:
-                result = all_images
-
-            return result
+            return self._all_except(functools.partial(self.search_by_captions, captions, entity_type, SearchOperator.IS_ONE_OF))
 
         # Handle IS_NOT operator by getting all images and removing IS results
         if search_operator == SearchOperator.IS_NOT:
-            # Get all images in the dataset
-            all_images = self.export_to_dataframe()
-            if all_images.empty:
-                return pd.DataFrame()
-
-            # Get the images that match all captions combined (IS logic)
-            matching_images = self.search_by_captions(captions, entity_type, SearchOperator.IS)
-
-            # Remove matching images from all images
-            if not matching_images.empty:
-                result = all_images[~all_images["media_id"].isin(matching_images["media_id"])]
-            else:
-                result = all_images
-
-            return result
+            return self._all_except(functools.partial(self.search_by_captions, captions, entity_type, SearchOperator.IS))
 
-        # Handle IS_ONE_OF operator by calling search_by_vql multiple times and combining results
+        # Handle IS_ONE_OF operator by running one search_by_vql per caption and combining results
         if search_operator == SearchOperator.IS_ONE_OF:
-            dfs = []
-            for caption in captions:
-                # Create VQL for single caption
-                vql = [{"text": {"op": "fts", "value": caption}}]
-
-                # Call search_by_vql for this caption
-                df = self.search_by_vql(vql, entity_type)
-                if df is not None and not df.empty:
-                    dfs.append(df)
-
-            # Combine results and remove duplicates
-            if dfs:
-                combined = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["media_id"])
-                return combined
-            else:
-                return pd.DataFrame()
+            return self._union_of_searches([functools.partial(self.search_by_vql, [{"text": {"op": "fts", "value": caption}}], entity_type) for caption in captions])
 
         # Handle other operators (existing logic)
         if search_operator != SearchOperator.IS:
@@ -451,46 +563,18 @@ class Dataset:
             raise ValueError(f"labels must be a list of strings, got {type(labels).__name__}")
 
         if isinstance(search_operator, str):
-            try:
-                search_operator = SearchOperator(search_operator)
-            except ValueError:
+            operator = _SEARCH_OPERATOR_BY_VALUE.get(search_operator)
+            if operator is None:
                 raise ValueError(f"Invalid search_operator for labels: {search_operator}")
+            search_operator = operator
 
         # Handle IS_NOT_ONE_OF operator by getting all images and removing IS_ONE_OF results
         if search_operator == SearchOperator.IS_NOT_ONE_OF:
-            # Get all images in the dataset
-            all_images = self.export_to_dataframe()
-            if all_images.empty:
-                return pd.DataFrame()
-
-            # Get the images that match any of the labels (IS_ONE_OF logic)
-            matching_images = self.search_by_labels(labels, entity_type, SearchOperator.IS_ONE_OF)
-
-            # Remove matching images from all images
-            if not matching_images.empty:
-                result = all_images[~all_images["media_id"].isin(matching_images["media_id"])]
-            else:
-                result = all_images
-
-            return result
+            return self._all_except(functools.partial(self.search_by_labels, labels, entity_type, SearchOperator.IS_ONE_OF))
 
         # Handle IS_NOT operator by getting all images and removing IS results
         if search_operator == SearchOperator.IS_NOT:
-            # Get all images in the dataset
-            all_images = self.export_to_dataframe()
-            if all_images.empty:
-                return pd.DataFrame()
-
-            # Get the images that match all labels combined (IS logic)
-            matching_images = self.search_by_labels(labels, entity_type, SearchOperator.IS)
-
-            # Remove matching images from all images
-            if not matching_images.empty:
-                result = all_images[~all_images["media_id"].isin(matching_images["media_id"])]
-            else:
-                result = all_images
-
-            return result
+            return self._all_except(functools.partial(self.search_by_labels, labels, entity_type, SearchOperator.IS))
 
         vql = [{"id": "label_filter", "labels": {"op": search_operator.value, "value": labels}}]
 
@@ -522,89 +606,72 @@ class Dataset:
         Examples:
             df = dataset.search_by_issues(issue_type=[IssueType.BLUR, IssueType.OUTLIERS], entity_type="IMAGES", search_operator=SearchOperator.IS, confidence_min=0.5, confidence_max=1.0)
         """
+        plan, vqls = self._issue_search_plan(issue_type, search_operator, confidence_min, confidence_max)
+
+        # IS_ONE_OF: one search per valid issue type, run concurrently and combined
+        if plan == "union":
+            return self._union_of_searches([functools.partial(self.search_by_vql, vql, entity_type) for vql in vqls])
+
+        # IS_NOT over several issue types: all images minus the IS results; a single issue type is
+        # negated on the server instead (mode "out") without exporting the whole dataset
+        if plan == "all_except":
+            return self._all_except(functools.partial(self.search_by_vql, vqls[0], entity_type))
+
+        if plan == "search":
+            # Call the general VQL search function
+            return self.search_by_vql(vqls[0], entity_type)
+
+        return pd.DataFrame()
+
+    def _issue_search_plan(self, issue_type, search_operator, confidence_min: float, confidence_max: float) -> tuple:
+        """
+        Resolve issue search arguments into VQL; shared by search_by_issues and count_by_issues so both
+        validate, warn and build queries identically.
+
+        Returns:
+            tuple: (plan, vqls), where plan is one of
+                "union": vqls holds one VQL per valid issue type, whose results are combined (IS_ONE_OF)
+                "all_except": vqls holds the VQL of the items to remove from the full export (IS_NOT over several types)
+                "search": vqls holds the single VQL to run
+                None: nothing to search; the reason has been logged
+        """
         if not issue_type:
             raise ValueError("issue_type must be provided")
 
         if isinstance(search_operator, str):
-            try:
-                search_operator = SearchOperator(search_operator)
-            except ValueError:
+            operator = _SEARCH_OPERATOR_BY_VALUE.get(search_operator)
+            if operator is None:
                 self.logger.warning(f"Invalid search_operator for issues: {search_operator}")
-                return pd.DataFrame()
+                return None, []
+            search_operator = operator
 
         if not isinstance(issue_type, list):
             issue_type = [issue_type]
 
-        # Handle IS_NOT operator by getting all images and removing IS results
-        if search_operator == SearchOperator.IS_NOT:
-            # Get all images in the dataset
-            all_images = self.export_to_dataframe()
-            if all_images.empty:
-                return pd.DataFrame()
-
-            # Get the images that match all issue types combined (IS logic)
-            matching_images = self.search_by_issues(issue_type, entity_type, SearchOperator.IS, confidence_min, confidence_max)
+        # Resolve issue names once and validate them with a single set difference
+        issue_names = [it.value for it in issue_type]
+        invalid_names = set(issue_names) - ALLOWED_ISSUE_NAMES
+        if invalid_names:
+            self.logger.warning(f"Invalid issue types {sorted(invalid_names)}. Allowed types: {_ALLOWED_ISSUE_NAMES_STR}")
 
-            # Remove matching images from all images
-            if not matching_images.empty:
-                result = all_images[~all_images["media_id"].isin(matching_images["media_id"])]
-            else:
-                result = all_images
+        def issues_vql(names, mode):
+            return [{"issues": {"op": "issue", "value": name, "confidence_min": confidence_min, "confidence_max": confidence_max, "mode": mode}} for name in names]
 
-            return result
-
-        # Handle IS_ONE_OF operator by calling search_by_vql multiple times and combining results
+        # IS_ONE_OF skips invalid issue types; every other operator searches nothing if any is invalid
         if search_operator == SearchOperator.IS_ONE_OF:
-            dfs = []
-            for it in issue_type:
-                # Create VQL for single issue type
-                issue_type_str = it.value
-                if issue_type_str not in ALLOWED_ISSUE_NAMES:
-                    self.logger.warning(f"Invalid issue type '{issue_type_str}'. Allowed types: {list(ALLOWED_ISSUE_NAMES)}")
-                    continue
-
-                vql = [{"issues": {"op": "issue", "value": issue_type_str, "confidence_min": confidence_min, "confidence_max": confidence_max, "mode": "in"}}]
-
-                # Call search_by_vql for this issue type
-                df = self.search_by_vql(vql, entity_type)
-                if df is not None and not df.empty:
-                    dfs.append(df)
-
-            # Combine results and remove duplicates
-            if dfs:
-                combined = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["media_id"])
-                return combined
-            else:
-                return pd.DataFrame()
-
-        # Handle other operators (existing logic)
-        mode = "in"
-        if search_operator == SearchOperator.IS_NOT_ONE_OF:
-            mode = "out"
-        elif search_operator == SearchOperator.IS_NOT and len(issue_type) == 1:
-            mode = "out"
-        elif search_operator == SearchOperator.IS:
-            mode = "in"
-        else:
-            self.logger.warning(f"Search operator {search_operator} is not implemented for issues yet.")
-            return pd.DataFrame()
-
-        # Accept a single IssueType or a list of IssueTypes
-        if isinstance(issue_type, list):
-            issue_types = issue_type
-        else:
-            issue_types = [issue_type]
+            return "union", [issues_vql([name], "in") for name in issue_names if name not in invalid_names]
+        if invalid_names:
+            return None, []
 
-        vql = []
-        for it in issue_types:
-            issue_type_str = it.value
-            if issue_type_str not in ALLOWED_ISSUE_NAMES:
-                self.logger.warning(f"Invalid issue type '{issue_type_str}'. Allowed types: {list(ALLOWED_ISSUE_NAMES)}")
-                return pd.DataFrame()
-            vql.append({"issues": {"op": "issue", "value": issue_type_str, "confidence_min": confidence_min, "confidence_max": confidence_max, "mode": mode}})
+        if search_operator == SearchOperator.IS_NOT and len(issue_names) > 1:
+            return "all_except", [issues_vql(issue_names, "in")]
+        if search_operator == SearchOperator.IS:
+            return "search", [issues_vql(issue_names, "in")]
+        if search_operator in (SearchOperator.IS_NOT, SearchOperator.IS_NOT_ONE_OF):
+            return "search", [issues_vql(issue_names, "out")]
 
-        # Call the general VQL search function
-        return self.search_by_vql(vql, entity_type)
+        self.logger.warning(f"Search operator {search_operator} is not implemented for issues yet.")
+        return None, []
 
     @typechecked
     def search_by_semantic(self, text: str, entity_type: str = "IMAGES", relevance: "SemanticRelevance" = SemanticRelevance.MEDIUM_RELEVANCE) -> pd.DataFrame:
@@ -640,13 +707,12 @@ class Dataset:
         # Step 1: Start async search and get initial status using the general VQL function
         return self.search_by_vql(vql, entity_type)
 
-    @typechecked
-    def search_by_vql(self, vql: List[dict], entity_type: str = "IMAGES") -> pd.DataFrame:
+    def search_by_vql(self, vql: List[dict] | str, entity_type: str = "IMAGES") -> pd.DataFrame:
         """
         Search dataset using custom VQL (Visual Query Language) asynchronously, poll until export is ready, download the results, and return as a DataFrame.
 
         Args:
-            vql (List[dict]): VQL query structure as a list of filter objects
+            vql (List[dict] or str): VQL query structure as a list of filter objects, or the same structure as a JSON string
             entity_type (str): Entity type to search ("IMAGES" or "OBJECTS", default: "IMAGES")
 
         Returns:
@@ -655,64 +721,226 @@ class Dataset:
         Examples:
             vql = [{"id": "label_filter", "labels": {"op": "one_of", "value": ["cat", "dog"]}}]
             df = dataset.search_by_vql(vql)
+            df = dataset.search_by_vql('[{"labels": {"op": "one_of", "value": ["cat", "dog"]}}]')
         """
-        if not vql:
-            self.logger.warning("No VQL provided for search")
-            return pd.DataFrame()
+        # Not @typechecked: every IS_ONE_OF sub-search comes through here, so only the cheap checks are made
+        _check_vql_args(vql, entity_type)
+        try:
+            download_uri = self._wait_for_vql_export(vql, entity_type)
+            if not download_uri:
+                return pd.DataFrame()
 
-        url = f"{self.base_url}/dataset/{self.dataset_id}/export_context_async"
-        params = {"export_format": "json", "include_images": False, "entity_type": entity_type, "vql": json.dumps(vql)}
+            # Step 2: Use the general processor
+            return self._process_export_download_to_dataframe(download_uri)
+        except Exception as e:
+            self.logger.error(f"VQL search failed: {str(e)}")
+            raise
 
-        try:
-            import time
+    def count_by_vql(self, vql: List[dict] | str, entity_type: str = "IMAGES") -> int:
+        """
+        Count the items matching a VQL query without building a DataFrame of the results.
+        The export is still run and its results downloaded, so this takes about as long as search_by_vql;
+        only the DataFrame construction is skipped.
 
-            start_time = time.time()
-            self.logger.info(f"Starting VQL search with query: {vql}")
-            response = self.client.session.get(url, headers=self.client._get_headers(), params=params)
-            response.raise_for_status()
-            status_result = response.json()
-            self.logger.success("VQL search export task created successfully")
-            download_uri = status_result.get("download_uri")
-            status = status_result.get("status")
-            export_task_id = status_result.get("id")
+        Args:
+            vql (List[dict] or str): VQL query structure as a list of filter objects, or the same structure as a JSON string
+            entity_type (str): Entity type to search ("IMAGES" or "OBJECTS", default: "IMAGES")
 
-            # If no download_uri in the first response, return empty DataFrame immediately
-            if status == "REJECTED" or status is None:
-                self.logger.info("No images matched the VQL search. Returning empty DataFrame.")
-                return pd.DataFrame()
+        Returns:
+            int: Number of matching items, or 0 if the export did not complete
 
-            # Poll if not ready
-            while (status != "COMPLETED" or not download_uri) and (time.time() - start_time < self.timeout):
-                self.logger.info(f"Export not ready (status: {status}). Waiting {self.poll_interval}s before polling again...")
-                time.sleep(self.poll_interval)
-                # Poll status endpoint
-                poll_status = self.client.session.get(
-                    f"{self.client.base_url}/dataset/{self.dataset_id}/export_status",
-                    headers=self.client._get_headers(),
-                    params={"export_task_id": export_task_id, "dataset_id": self.dataset_id},
-                )
-                poll_status.raise_for_status()
-                status_result = poll_status.json()
-                download_uri = status_result.get("download_uri")
-                status = status_result.get("status")
-
-                # Check if export was rejected during polling
-                if status == "REJECTED":
-                    result_message = status_result.get("result_message", "No reason provided")
-                    self.logger.error(f"Export request rejected during polling: {result_message}")
-                    print(f"❌ Export request rejected during polling: {result_message}")
-                    return pd.DataFrame()
+        Examples:
+            count = dataset.count_by_vql([{"labels": {"op": "one_of", "value": ["cat", "dog"]}}])
+        """
+        _check_vql_args(vql, entity_type)
+        return len(self._search_media_items_by_vql(vql, entity_type))
+
+    @typechecked
+    def count_by_issues(
+        self,
+        issue_type: "IssueType | List[IssueType]" = None,
+        entity_type: str = "IMAGES",
+        search_operator: "SearchOperator" = SearchOperator.IS,
+        confidence_min: float = 0.8,
+        confidence_max: float = 1.0,
+    ) -> int:
+        """
+        Count the items matching an issue search without building a DataFrame of the results.
+        Equivalent to len(search_by_issues(...)) for the same arguments, and about as costly: the exports are
+        still run and downloaded (IS_ONE_OF concurrently, one per issue type), only the DataFrames are skipped.
 
-            if status != "COMPLETED" or not download_uri:
-                self.logger.warning(f"Export not completed or no download_uri after waiting. Final status: {status}")
+        Args:
+            issue_type (IssueType or List[IssueType]): Issue type(s) to search for (e.g., IssueType.BLUR, IssueType.DARK, IssueType.OUTLIERS)
+            entity_type (str): Entity type to search ("IMAGES" or "OBJECTS", default: "IMAGES")
+            search_operator (SearchOperator): Search operator for issues (default: SearchOperator.IS)
+            confidence_min (float): Minimum confidence threshold (default: 0.8)
+            confidence_max (float): Maximum confidence threshold (default: 1.0)
+
+        Returns:
+            int: Number of matching items
+
+        Examples:
+            count = dataset.count_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_ONE_OF)
+        """
+        plan, vqls = self._issue_search_plan(issue_type, search_operator, confidence_min, confidence_max)
+
+        if plan == "union":
+            if not vqls:
+                return 0
+            # Union of the per-issue results, deduplicated by media_id as in search_by_issues; the exports are
+            # independent, so they run concurrently like the sub-searches in _union_of_searches
+            searches = [functools.partial(self._search_media_items_by_vql, vql, entity_type) for vql in vqls]
+            with ThreadPoolExecutor(max_workers=min(len(searches), _MAX_CONCURRENT_SEARCHES)) as executor:
+                media_ids = {item.get("media_id") for items in executor.map(_in_caller_context(), searches) for item in items}
+            return len(media_ids)
+
+        # IS_NOT over several issue types is computed client-side against the full export
+        if plan == "all_except":
+            return len(self._all_except(functools.partial(self.search_by_vql, vqls[0], entity_type)))
+
+        if plan == "search":
+            return self.count_by_vql(vqls[0], entity_type)
+
+        return 0
+
+    def _all_except(self, matching_search) -> pd.DataFrame:
+        """
+        Return every item in the dataset except those found by matching_search, a zero-argument callable
+        returning a DataFrame. The full export and the positive search are independent, so they run concurrently.
+        """
+        cancelled = threading.Event()
+
+        def run_matching_search():
+            _search_cancelled.set(cancelled)
+            return matching_search()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            matching_future = executor.submit(contextvars.copy_context().run, run_matching_search)
+            all_images = self.export_to_dataframe(stream=ijson is not None)
+            if all_images.empty:
                 return pd.DataFrame()
+            matching_images = matching_future.result()
+        finally:
+            # Don't hold the caller on a positive search whose result is no longer needed (empty or failed export),
+            # and stop it polling the server in the background
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if matching_images.empty:
+            return all_images
+        return all_images[~all_images["media_id"].isin(matching_images["media_id"])]
+
+    def _union_of_searches(self, searches: list) -> pd.DataFrame:
+        """
+        Run independent searches concurrently and combine their results.
 
-            # Step 2: Use the general processor
-            return self._process_export_download_to_dataframe(download_uri)
+        Each search is a zero-argument callable returning a DataFrame. Their exports are started and polled in
+        parallel, so the total wait is roughly that of the slowest search rather than the sum of all of them.
+        Results are concatenated in the order of searches, keeping the first row for each media_id.
+        """
+        if not searches:
+            return pd.DataFrame()
+        with ThreadPoolExecutor(max_workers=min(len(searches), _MAX_CONCURRENT_SEARCHES)) as executor:
+            dfs = [df for df in executor.map(_in_caller_context(), searches) if df is not None and not df.empty]
+        if not dfs:
+            return pd.DataFrame()
+        return pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["media_id"])
+
+    def _search_media_items_by_vql(self, vql: List[dict] | str, entity_type: str) -> list:
+        """Run a VQL export and return the raw media_items, or an empty list if there are none"""
+        try:
+            download_uri = self._wait_for_vql_export(vql, entity_type)
+            if not download_uri:
+                return []
+            export_data = self._download_export_results(download_uri)
+            return export_data.get("media_items", [])
         except Exception as e:
             self.logger.error(f"VQL search failed: {str(e)}")
             raise
 
+    def _wait_for_vql_export(self, vql: List[dict] | str, entity_type: str) -> str | None:
+        """
+        Start an async VQL export and poll until it completes.
+
+        Args:
+            vql (List[dict] or str): VQL query structure, or the same structure as a JSON string
+            entity_type (str): Entity type to search ("IMAGES" or "OBJECTS")
+
+        Returns:
+            str | None: The download URI of the completed export, or None if nothing matched or the export did not complete
+        """
+        if isinstance(vql, str):
+            # JSON strings are validated once (memoized) and sent as-is
+            vql_json = vql
+            vql = _parse_vql(vql)
+            if not isinstance(vql, list):
+                raise ValueError("VQL string must encode a list of filter objects")
+        else:
+            vql_json = _dump_vql(vql)
+
+        if not vql:
+            self.logger.warning("No VQL provided for search")
+            return None
+
+        cancelled = _search_cancelled.get()
+        if cancelled is not None and cancelled.is_set():
+            return None
+
+        url = f"{self.base_url}/dataset/{self.dataset_id}/export_context_async"
+        params = {"export_format": "json", "include_images": False, "entity_type": entity_type, "vql": vql_json}
+
+        start_time = time.time()
+        self.logger.info(f"Starting VQL search with query: {vql}")
+        response = self.client.session.get(url, headers=self.client._get_headers(), params=params)
+        response.raise_for_status()
+        status_result = response.json()
+        self.logger.success("VQL search export task created successfully")
+        download_uri = status_result.get("download_uri")
+        status = status_result.get("status")
+        export_task_id = status_result.get("id")
+
+        # If no download_uri in the first response, return immediately
+        if status == "REJECTED" or status is None:
+            self.logger.info("No images matched the VQL search.")
+            return None
+
+        # Poll if not ready, unless the search is cancelled meanwhile (see _search_cancelled). Headers are still fetched per request (a cached mapping) so that a token expiring
+        # mid-poll is refreshed; connection reuse and retries on 5xx come from the client's session adapter
+        poll_url = f"{self.base_url}/dataset/{self.dataset_id}/export_status"
+        poll_params = {"export_task_id": export_task_id, "dataset_id": self.dataset_id}
+        attempt = 0
+        while (status != "COMPLETED" or not download_uri) and (time.time() - start_time < self.timeout):
+            # Back off exponentially from a short first wait up to poll_interval, so quick exports are picked up
+            # almost immediately; the jitter keeps concurrent searches from polling in lockstep
+            delay = min(self.poll_interval, _FIRST_POLL_DELAY * 2**attempt) + random.uniform(0, _POLL_JITTER)
+            attempt += 1
+            self.logger.info(f"Export not ready (status: {status}). Waiting {delay:.2f}s before polling again...")
+            if cancelled is None:
+                time.sleep(delay)
+            elif cancelled.wait(delay):
+                self.logger.info("Export polling stopped: search result no longer needed")
+                return None
+            # Poll status endpoint
+            poll_status = self.client.session.get(poll_url, headers=self.client._get_headers(), params=poll_params)
+            poll_status.raise_for_status()
+            status_result = poll_status.json()
+            download_uri = status_result.get("download_uri")
+            status = status_result.get("status")
+
+            # Check if export was rejected during polling
+            if status == "REJECTED":
+                result_message = status_result.get("result_message", "No reason provided")
+                self.logger.error(f"Export request rejected during polling: {result_message}")
+                print(f"❌ Export request rejected during polling: {result_message}")
+                return None
+
+        if status != "COMPLETED" or not download_uri:
+            self.logger.warning(f"Export not completed or no download_uri after waiting. Final status: {status}")
+            return None
+
+        return download_uri
+
     def _download_export_results(self, download_uri: str) -> dict:
         """
         Download the export results from the provided URI.
@@ -733,32 +961,30 @@ class Dataset:
             response.raise_for_status()
 
             content_type = response.headers.get("content-type", "")
-            self.logger.debug(f"Response content type: {content_type}")
-            self.logger.debug(f"Response status code: {response.status_code}")
-            self.logger.debug(f"Response size: {len(response.content)} bytes")
+            self.logger.debug("Response content type: %s", content_type)
+            self.logger.debug("Response status code: %s", response.status_code)
+            self.logger.debug("Response size: %d bytes", len(response.content))
 
             # Try ZIP extraction first (since we know it works)
             self.logger.info("Attempting ZIP extraction...")
             try:
                 with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-                    self.logger.debug(f"ZIP contents: {zf.namelist()}")
+                    self.logger.debug("ZIP contents: %s", zf.namelist())
 
                     # Look specifically for metadata.json
                     if "metadata.json" in zf.namelist():
                         self.logger.info("Found metadata.json")
                         with zf.open("metadata.json") as json_file:
-                            json_bytes = json_file.read()
-                            json_str = json_bytes.decode("utf-8")
-                            result = json.loads(json_str)
+                            result = _loads(json_file.read())
                             self.logger.info("Successfully extracted and parsed JSON")
-                            self.logger.debug(f"JSON keys: {list(result.keys())}")
+                            self.logger.debug("JSON keys: %s", list(result.keys()))
                             if "media_items" in result:
                                 self.logger.info(f"Number of media items: {len(result['media_items'])}")
                             self.logger.success("Export results downloaded and extracted from ZIP successfully")
                             return result
                     else:
                         self.logger.warning("metadata.json not found")
-                        self.logger.debug(f"Available files: {zf.namelist()}")
+                        self.logger.debug("Available files: %s", zf.namelist())
                         raise ValueError("metadata.json not found in ZIP archive.")
 
             except Exception as zip_error:
@@ -767,20 +993,20 @@ class Dataset:
 
             # If ZIP extraction failed, try JSON parsing
             if "application/json" in content_type:
-                result = response.json()
+                result = _loads(response.content)
                 self.logger.debug("Parsed as JSON")
-                self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                self.logger.debug("Response keys: %s", list(result.keys()) if isinstance(result, dict) else "Not a dict")
                 self.logger.success("Export results downloaded successfully")
                 return result
             else:
                 # Handle non-JSON responses (like text)
-                self.logger.debug(f"Content type: {content_type}")
-                self.logger.debug(f"Response size: {len(response.content)} bytes")
+                self.logger.debug("Content type: %s", content_type)
+                self.logger.debug("Response size: %d bytes", len(response.content))
                 # Try to parse as JSON anyway (in case content-type is wrong)
                 try:
-                    result = response.json()
+                    result = _loads(response.content)
                     self.logger.info("Successfully parsed as JSON")
-                    self.logger.debug(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                    self.logger.debug("Response keys: %s", list(result.keys()) if isinstance(result, dict) else "Not a dict")
                 except Exception as json_error:
                     self.logger.warning(f"Failed to parse as JSON: {str(json_error)}")
                     result = {"content_type": content_type, "size_bytes": len(response.content), "raw_text": response.text[:1000], "error": "Response is not valid JSON"}
@@ -834,22 +1060,21 @@ class Dataset:
             with open(image_path, "rb") as file:
                 files = {"file": (file_path.name, file, content_type)}
 
-                # Remove Content-Type header to let requests set it for multipart
-                headers = self.client._get_headers()
-                headers.pop("Content-Type", None)
+                # Let requests set the multipart Content-Type (with its boundary)
+                headers = {name: value for name, value in self.client._get_headers().items() if name != "Content-Type"}
 
-                self.logger.debug(f"URL: {url}")
-                self.logger.debug(f"Params: {params}")
-                self.logger.debug(f"Headers: {headers}")
-                self.logger.debug(f"File: {file_path.name}, Content-Type: {content_type}")
+                self.logger.debug("URL: %s", url)
+                self.logger.debug("Params: %s", params)
+                self.logger.debug("Headers: %s", headers)
+                self.logger.debug("File: %s, Content-Type: %s", file_path.name, content_type)
 
                 response = self.client.session.post(url, headers=headers, params=params, files=files)
 
-                self.logger.debug(f"Response status: {response.status_code}")
-                self.logger.debug(f"Response headers: {dict(response.headers)}")
+                self.logger.debug("Response status: %s", response.status_code)
+                self.logger.debug("Response headers: %s", response.headers)
 
-                if response.status_code != 200:
-                    self.logger.debug(f"Response text: {response.text}")
+                if response.status_code != 200 and self.logger.debug_enabled():
+                    self.logger.debug("Response text: %s", response.text)
 
                 response.raise_for_status()
                 result = response.json()
@@ -929,6 +1154,15 @@ class Dataset:
         Returns:
             dict: {"labels_search": bool or None, "captions_search": bool or None, "raw": full_response}
         """
+        # Every caption/label/semantic search (and each IS_ONE_OF sub-search) checks the config, so reuse it briefly
+        cached = self._user_config_cache
+        if cached is not None and time.monotonic() - cached[0] < _USER_CONFIG_TTL:
+            return cached[1]
+        user_config = self._fetch_user_config()
+        self._user_config_cache = (time.monotonic(), user_config)
+        return user_config
+
+    def _fetch_user_config(self) -> dict:
         url = f"{self.base_url}/user_config"
         params = {"dataset_id": self.dataset_id}
         headers = self.client._get_headers()
@@ -1008,13 +1242,12 @@ class Dataset:
 
         url = f"{self.base_url}/dataset/{self.dataset_id}/enrich_dataset"
         headers = self.client._get_headers()
-        headers["Content-Type"] = "application/json"
 
         enrichment_config = {"enrichment_models": enrichment_models}
 
         try:
             self.logger.info(f"Starting enrichment for dataset {self.dataset_id}")
-            self.logger.debug(f"Enrichment config: {enrichment_config}")
+            self.logger.debug("Enrichment config: %s", enrichment_config)
 
             response = self.client.session.post(url, headers=headers, json=enrichment_config)
             response.raise_for_status()
@@ -1,82 +1,327 @@
+import atexit
+import contextlib
+import functools
+import heapq
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
 from datetime import datetime
-from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+# Console output is the bare message (no timestamp is computed); files get the rich format
+_CONSOLE_FORMATTER = logging.Formatter("%(message)s")
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# Handlers shared across logger reconfigurations, keyed by (kind, stream or file path)
+_HANDLER_CACHE: Dict[tuple, logging.Handler] = {}
+
+# Number of records a buffered file handler holds before writing them out
+_BUFFER_CAPACITY = 512
+
+
+def _get_cached_handler(key: tuple, create_handler: Callable[[], logging.Handler], formatter: logging.Formatter) -> logging.Handler:
+    """Return the handler cached under key, creating it on first use"""
+    handler = _HANDLER_CACHE.get(key)
+    if handler is None:
+        handler = create_handler()
+        handler.setFormatter(formatter)
+        _HANDLER_CACHE[key] = handler
+    else:
+        # Reset any level set on the shared handler by a previous configuration
+        handler.setLevel(logging.NOTSET)
+    return handler
+
+
+class _BatchFilter(logging.Filter):
+    """Logger filter that holds back the records of threads inside VisualLayerLogger.batch()"""
+
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+
+    def open_batches(self) -> List[List[logging.LogRecord]]:
+        """Record lists of the batches open in the current thread, innermost last"""
+        batches = getattr(self._local, "batches", None)
+        if batches is None:
+            batches = self._local.batches = []
+        return batches
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        batches = getattr(self._local, "batches", None)
+        if batches:
+            batches[-1].append(record)
+            return False
+        return True
+
+
+_BATCH_FILTER = _BatchFilter()
+
+
+class _Utf8FileHandler(logging.FileHandler):
+    """FileHandler that encodes records to UTF-8 itself and appends them to an unbuffered binary file"""
+
+    def __init__(self, filename: str, delay: bool = True):
+        super().__init__(filename, mode="ab", delay=delay)
+
+    def _open(self):
+        # Raw file object: each write is one syscall, with no TextIOWrapper encoding or buffering layer
+        return open(self.baseFilename, self.mode, buffering=0)
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        return (self.format(record) + self.terminator).encode("utf-8", "replace")
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self._encode(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records: List[logging.LogRecord]):
+        """Write several records with a single write call"""
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(b"".join(self._encode(record) for record in records))
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(records[0])
+
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that hands its whole buffer to the target at once instead of record by record"""
+
+    def flush(self):
+        with self.lock:
+            if self.target is not None and self.buffer:
+                _write_batch([self.target], self.buffer)
+                self.buffer.clear()
+
+
+def _write_batch(handlers: List[logging.Handler], records: List[logging.LogRecord]):
+    """Send collected records to handlers, joining them into one write for plain open streams"""
+    for handler in handlers:
+        accepted = [record for record in records if record.levelno >= handler.level and handler.filter(record)]
+        if not accepted:
+            continue
+
+        if isinstance(handler, _Utf8FileHandler):
+            handler.emit_batch(accepted)
+            continue
+
+        # Rotating, queue and buffer handlers (and files not opened yet) keep their own per-record emit logic
+        if type(handler) not in (logging.StreamHandler, logging.FileHandler) or handler.stream is None:
+            for record in accepted:
+                handler.handle(record)
+            continue
+
+        text = "".join(handler.format(record) + handler.terminator for record in accepted)
+        with handler.lock:
+            handler.stream.write(text)
+            handler.flush()
+
+
+def _release_handlers(old_handlers: List[logging.Handler], keep: List[logging.Handler]):
+    """Close file handlers (and the buffers wrapping them) that are no longer in use, dropping them from the cache"""
+    in_use = set(keep) | {getattr(handler, "target", None) for handler in keep}
+    for handler in old_handlers:
+        for candidate in (handler, getattr(handler, "target", None)):
+            if candidate in in_use or not isinstance(getattr(candidate, "target", candidate), logging.FileHandler):
+                continue
+            # Closing a MemoryHandler flushes it into its file first
+            candidate.close()
+            for key, cached in list(_HANDLER_CACHE.items()):
+                if cached is candidate:
+                    del _HANDLER_CACHE[key]
+
+
+# Log directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(file_path: str):
+    """Create the parent directory of file_path once per process"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+# Message templates for the operation helpers, with the level emoji already applied
+_DATASET_CREATED = "✅ Dataset '{dataset_name}' created successfully (ID: {dataset_id})"
+_DATASET_UPLOADING = "📤 Uploading files for dataset '{dataset_name}'..."
+_DATASET_UPLOADED = "✅ Files uploaded successfully for dataset '{dataset_name}'"
+_DATASET_PROCESSING = "🔄 Processing dataset '{dataset_name}'..."
+_DATASET_READY = "✅ Dataset '{dataset_name}' is ready for use"
+_DATASET_NOT_READY = "⚠️  Dataset {dataset_id} is not ready (status: {status})"
+_SEARCH_STARTED = "🔍 Searching for '{query}' using {search_type}..."
+_SEARCH_COMPLETED = "✅ Found {count} images matching '{query}' using {search_type}"
+_SEARCH_EMPTY = "No images found matching '{query}' using {search_type}"
+_API_HEALTH_CHECK = "✅ API Health Status: {status}"
+_REQUEST_DETAILS = "{method} {url}"
+_REQUEST_SUCCESS = "Request successful (Status: {status_code})"
+_REQUEST_ERROR = "❌ Request failed: {error}"
+_EXPORT_STARTED = "📤 Exporting dataset {dataset_id}..."
+_EXPORT_COMPLETED = "✅ Exported {item_count} items from dataset {dataset_id}"
+_EXPORT_FAILED = "❌ Failed to export dataset {dataset_id}: {error}"
+
+
+def _default_log_file(log_dir: str = None, rotate_daily: bool = False) -> str:
+    """Default log file path following standard conventions; dated unless the file rotates daily"""
+    if log_dir is None:
+        # Use standard log directory locations
+        if os.name == "nt":  # Windows
+            # Windows: %APPDATA%/VisualLayer/logs/
+            appdata = os.getenv("APPDATA", "")
+            if appdata:
+                log_dir = os.path.join(appdata, "VisualLayer", "logs")
+            else:
+                log_dir = "logs"
+        else:  # Unix/Linux/macOS
+            # Unix: ~/.local/share/visual-layer/logs/ or /var/log/visual-layer/
+            home = os.path.expanduser("~")
+            log_dir = os.path.join(home, ".local", "share", "visual-layer", "logs")
+
+    # A rotating handler adds the date suffix itself when it rolls the file over
+    if rotate_daily:
+        return os.path.join(log_dir, "visual_layer_sdk.log")
+
+    # Create timestamp for daily log files
+    timestamp = datetime.now().strftime("%Y-%m-%d")
+    return os.path.join(log_dir, f"visual_layer_sdk_{timestamp}.log")
 
 
 class VisualLayerLogger:
     """Logger for Visual Layer SDK with natural output messages"""
 
-    def __init__(self, name: str = "visual_layer_sdk", level: int = logging.INFO, output_destinations: List[str] = None, log_file: str = None, log_dir: str = None):
+    def __init__(
+        self,
+        name: str = "visual_layer_sdk",
+        level: int = logging.INFO,
+        output_destinations: List[str] = None,
+        log_file: str = None,
+        log_dir: str = None,
+        buffered: bool = False,
+        async_queue: bool = False,
+        rotate_daily: bool = False,
+    ):
         self.logger = logging.getLogger(name)
+        # Background thread writing file records when async_queue is enabled
+        self.listener: Optional[logging.handlers.QueueListener] = None
         self.logger.setLevel(level)
 
-        # Clear existing handlers to avoid duplicates
-        self.logger.handlers.clear()
-
         # Default to stdout if no destinations specified
         if output_destinations is None:
             output_destinations = ["stdout"]
 
-        # Add handlers based on destinations
+        # Build handlers based on destinations
+        handlers = []
+        queued_handlers = []
         for destination in output_destinations:
             if destination == "stdout":
-                self._add_stdout_handler()
+                handlers.append(self._get_stream_handler(sys.stdout))
             elif destination == "stderr":
-                self._add_stderr_handler()
-            elif destination == "file" and log_file:
-                self._add_file_handler(log_file)
+                handlers.append(self._get_stream_handler(sys.stderr))
             elif destination == "file":
                 # Use default log file if none specified
-                default_log_file = self._get_default_log_file(log_dir)
-                self._add_file_handler(default_log_file)
-
-    def _add_stdout_handler(self):
-        """Add stdout handler"""
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter("%(message)s")
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-
-    def _add_stderr_handler(self):
-        """Add stderr handler"""
-        handler = logging.StreamHandler(sys.stderr)
-        formatter = logging.Formatter("%(message)s")
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-
-    def _add_file_handler(self, log_file: str):
-        """Add file handler"""
+                file_handler = self._get_file_handler(log_file or self._get_default_log_file(log_dir, rotate_daily), buffered, rotate_daily)
+                if async_queue:
+                    queued_handlers.append(file_handler)
+                else:
+                    handlers.append(file_handler)
+
+        if queued_handlers:
+            handlers.append(self._start_queue_listener(queued_handlers))
+
+        # Replace the previous handlers in one step, so records logged meanwhile never see a half-built list
+        self.logger.handlers[:] = handlers
+
+    def _start_queue_listener(self, handlers: List[logging.Handler]) -> logging.Handler:
+        """Route records for handlers through a queue drained by a background thread"""
+        log_queue = queue.Queue(-1)
+        self.listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        return logging.handlers.QueueHandler(log_queue)
+
+    def output_handlers(self) -> List[logging.Handler]:
+        """Handlers that write records, including those run by the queue listener"""
+        return self.logger.handlers + list(self.listener.handlers if self.listener else ())
+
+    def stop(self):
+        """Stop the background listener, writing out any records still queued"""
+        if self.listener is not None:
+            listener, self.listener = self.listener, None
+            listener.stop()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["VisualLayerLogger"]:
+        """
+        Collect the records logged inside the block and write them out together when it exits.
+
+        Each console or file stream receives a single write instead of one per record.
+
+        Examples:
+            >>> logger = get_logger()
+            >>> with logger.batch():
+            ...     logger.dataset_created("123", "My Dataset")
+            ...     logger.dataset_ready("My Dataset")
+        """
+        # Records are held per thread, so batches in other threads and their unbatched logging are unaffected
+        self.logger.addFilter(_BATCH_FILTER)
+        batches = _BATCH_FILTER.open_batches()
+        records: List[logging.LogRecord] = []
+        batches.append(records)
+        try:
+            yield self
+        finally:
+            batches.pop()
+            if batches:
+                # Nested batch: the enclosing one writes these out with its own records
+                batches[-1].extend(records)
+            else:
+                _write_batch(self.logger.handlers[:], records)
+
+    def _get_stream_handler(self, stream) -> logging.Handler:
+        """Get console handler for stdout or stderr"""
+        return _get_cached_handler(("stream", stream), functools.partial(logging.StreamHandler, stream), _CONSOLE_FORMATTER)
+
+    def _get_file_handler(self, log_file: str, buffered: bool = False, rotate_daily: bool = False) -> logging.Handler:
+        """Get file handler, optionally rotated at midnight and/or behind a memory buffer that writes records in batches"""
         # Create logs directory if it doesn't exist
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-
-    def _get_default_log_file(self, log_dir: str = None) -> str:
+        _ensure_dir(log_file)
+
+        # delay=True defers opening the file until the first record is emitted
+        log_path = os.path.abspath(log_file)
+        if rotate_daily:
+            # Rolls over in-process to <log_file>.YYYY-MM-DD, so long-running processes get one file per day
+            kind = "rotating_file"
+            create_handler = functools.partial(logging.handlers.TimedRotatingFileHandler, log_file, when="midnight", encoding="utf-8", delay=True, utc=True)
+        else:
+            kind = "file"
+            create_handler = functools.partial(_Utf8FileHandler, log_file, delay=True)
+        file_handler = _get_cached_handler((kind, log_path), create_handler, _FILE_FORMATTER)
+        if not buffered:
+            return file_handler
+
+        # Flushed when full, on ERROR records, and at interpreter shutdown via logging.shutdown()
+        return _get_cached_handler(
+            ("buffered_" + kind, log_path),
+            lambda: _BatchingMemoryHandler(_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True),
+            _FILE_FORMATTER,
+        )
+
+    def _get_default_log_file(self, log_dir: str = None, rotate_daily: bool = False) -> str:
         """Get default log file path following standard conventions"""
-        if log_dir is None:
-            # Use standard log directory locations
-            if os.name == "nt":  # Windows
-                # Windows: %APPDATA%/VisualLayer/logs/
-                appdata = os.getenv("APPDATA", "")
-                if appdata:
-                    log_dir = os.path.join(appdata, "VisualLayer", "logs")
-                else:
-                    log_dir = "logs"
-            else:  # Unix/Linux/macOS
-                # Unix: ~/.local/share/visual-layer/logs/ or /var/log/visual-layer/
-                home = os.path.expanduser("~")
-                log_dir = os.path.join(home, ".local", "share", "visual-layer", "logs")
-
-        # Create timestamp for daily log files
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        return os.path.join(log_dir, f"visual_layer_sdk_{timestamp}.log")
+        return _default_log_file(log_dir, rotate_daily)
 
     def info(self, message: str):
         """Log info message"""
@@ -84,87 +329,117 @@ class VisualLayerLogger:
 
     def warning(self, message: str):
         """Log warning message"""
-        self.logger.warning(f"⚠️  {message}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(f"⚠️  {message}")
 
     def error(self, message: str):
         """Log error message"""
-        self.logger.error(f"❌ {message}")
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(f"❌ {message}")
 
     def success(self, message: str):
         """Log success message"""
-        self.logger.info(f"✅ {message}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"✅ {message}")
 
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def _log(self, level: int, template: str, **fields):
+        """Format a message template and log it, skipping the formatting when the level is disabled"""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, template.format(**fields))
+
+    def debug(self, message: str, *args):
+        """Log debug message; %-style args are only formatted when debug output is enabled"""
+        self.logger.debug(message, *args)
+
+    def debug_enabled(self) -> bool:
+        """Whether debug messages are emitted, for callers whose arguments are expensive to build"""
+        return self.logger.isEnabledFor(logging.DEBUG)
 
     def dataset_created(self, dataset_id: str, dataset_name: str):
         """Log dataset creation success"""
-        self.success(f"Dataset '{dataset_name}' created successfully (ID: {dataset_id})")
+        self._log(logging.INFO, _DATASET_CREATED, dataset_id=dataset_id, dataset_name=dataset_name)
 
     def dataset_uploading(self, dataset_name: str):
         """Log dataset upload start"""
-        self.info(f"📤 Uploading files for dataset '{dataset_name}'...")
+        self._log(logging.INFO, _DATASET_UPLOADING, dataset_name=dataset_name)
 
     def dataset_uploaded(self, dataset_name: str):
         """Log dataset upload completion"""
-        self.success(f"Files uploaded successfully for dataset '{dataset_name}'")
+        self._log(logging.INFO, _DATASET_UPLOADED, dataset_name=dataset_name)
 
     def dataset_processing(self, dataset_name: str):
         """Log dataset processing start"""
-        self.info(f"🔄 Processing dataset '{dataset_name}'...")
+        self._log(logging.INFO, _DATASET_PROCESSING, dataset_name=dataset_name)
 
     def dataset_ready(self, dataset_name: str):
         """Log dataset ready status"""
-        self.success(f"Dataset '{dataset_name}' is ready for use")
+        self._log(logging.INFO, _DATASET_READY, dataset_name=dataset_name)
 
     def dataset_not_ready(self, dataset_id: str, status: str):
         """Log dataset not ready warning"""
-        self.warning(f"Dataset {dataset_id} is not ready (status: {status})")
+        self._log(logging.WARNING, _DATASET_NOT_READY, dataset_id=dataset_id, status=status)
 
     def search_started(self, search_type: str, query: str):
         """Log search operation start"""
-        self.info(f"🔍 Searching for '{query}' using {search_type}...")
+        self._log(logging.INFO, _SEARCH_STARTED, search_type=search_type, query=query)
 
     def search_completed(self, count: int, search_type: str, query: str):
         """Log search operation completion"""
         if count > 0:
-            self.success(f"Found {count} images matching '{query}' using {search_type}")
+            self._log(logging.INFO, _SEARCH_COMPLETED, count=count, search_type=search_type, query=query)
         else:
-            self.info(f"No images found matching '{query}' using {search_type}")
+            self._log(logging.INFO, _SEARCH_EMPTY, search_type=search_type, query=query)
 
     def api_health_check(self, status: dict):
         """Log API health check result"""
-        self.success(f"API Health Status: {status}")
+        self._log(logging.INFO, _API_HEALTH_CHECK, status=status)
 
     def request_details(self, url: str, method: str = "GET"):
         """Log request details (debug level)"""
-        self.debug(f"{method} {url}")
+        self._log(logging.DEBUG, _REQUEST_DETAILS, method=method, url=url)
 
     def request_success(self, status_code: int):
         """Log successful request"""
-        self.debug(f"Request successful (Status: {status_code})")
+        self._log(logging.DEBUG, _REQUEST_SUCCESS, status_code=status_code)
 
     def request_error(self, error: str):
         """Log request error"""
-        self.error(f"Request failed: {error}")
+        self._log(logging.ERROR, _REQUEST_ERROR, error=error)
 
     def export_started(self, dataset_id: str):
         """Log export operation start"""
-        self.info(f"📤 Exporting dataset {dataset_id}...")
+        self._log(logging.INFO, _EXPORT_STARTED, dataset_id=dataset_id)
 
     def export_completed(self, dataset_id: str, item_count: int):
         """Log export operation completion"""
-        self.success(f"Exported {item_count} items from dataset {dataset_id}")
+        self._log(logging.INFO, _EXPORT_COMPLETED, dataset_id=dataset_id, item_count=item_count)
 
     def export_failed(self, dataset_id: str, error: str):
         """Log export operation failure"""
-        self.error(f"Failed to export dataset {dataset_id}: {error}")
+        self._log(logging.ERROR, _EXPORT_FAILED, dataset_id=dataset_id, error=error)
 
 
 # Global logger instance
 _logger: Optional[VisualLayerLogger] = None
 
+# Arguments of the last configure_logging call and the logger state it produced, used to skip rebuilding an
+# identical setup that nothing has changed since
+_CURRENT_CFG: Optional[tuple] = None
+
+
+def _logger_state(logger: VisualLayerLogger) -> tuple:
+    """The live level and handlers (with their levels) of a logger, to detect changes made outside configure_logging"""
+    return logger.logger.level, tuple((handler, handler.level) for handler in logger.output_handlers())
+
+
+def _stop_logger():
+    """Drain the global logger's queue before logging.shutdown() closes the handlers"""
+    if _logger is not None:
+        _logger.stop()
+
+
+atexit.register(_stop_logger)
+
 
 def get_logger() -> VisualLayerLogger:
     """Get the global logger instance"""
@@ -176,10 +451,12 @@ def get_logger() -> VisualLayerLogger:
 
 def set_log_level(level: int):
     """Set the log level for the global logger"""
-    global _logger
+    global _logger, _CURRENT_CFG
     if _logger is None:
         _logger = VisualLayerLogger()
     _logger.logger.setLevel(level)
+    # The level no longer matches the cached configuration
+    _CURRENT_CFG = None
 
 
 def set_verbose(verbose: bool = True):
@@ -188,7 +465,9 @@ def set_verbose(verbose: bool = True):
     set_log_level(level)
 
 
-def configure_logging(output_destinations: List[str] = None, log_file: str = None, level: int = logging.INFO, log_dir: str = None):
+def configure_logging(
+    output_destinations: List[str] = None, log_file: str = None, level: int = logging.INFO, log_dir: str = None, buffered: bool = False, async_queue: bool = False, rotate_daily: bool = False
+):
     """
     Configure logging output destinations and settings.
 
@@ -197,9 +476,24 @@ def configure_logging(output_destinations: List[str] = None, log_file: str = Non
         log_file: Path to log file (required if "file" is in destinations)
         level: Logging level
         log_dir: Directory for log files (if not using default)
+        buffered: Buffer file records in memory and write them in batches (flushed on ERROR and at exit)
+        async_queue: Write file records from a background thread so logging calls only enqueue them
+        rotate_daily: Roll the log file over at midnight (UTC) instead of naming it after the start date
     """
-    global _logger
-    _logger = VisualLayerLogger(level=level, output_destinations=output_destinations, log_file=log_file, log_dir=log_dir)
+    global _logger, _CURRENT_CFG
+    # The default file name carries the date, so an identical call on a later day resolves to a new file
+    resolved_log_file = log_file or _default_log_file(log_dir, rotate_daily)
+    config = (None if output_destinations is None else tuple(output_destinations), resolved_log_file, level, log_dir, buffered, async_queue, rotate_daily)
+    if _logger is not None and _CURRENT_CFG == (config, _logger_state(_logger)):
+        return
+
+    old_handlers = []
+    if _logger is not None:
+        old_handlers = _logger.output_handlers()
+        _logger.stop()
+    _logger = VisualLayerLogger(level=level, output_destinations=output_destinations, log_file=log_file, log_dir=log_dir, buffered=buffered, async_queue=async_queue, rotate_daily=rotate_daily)
+    _CURRENT_CFG = (config, _logger_state(_logger))
+    _release_handlers(old_handlers, _logger.output_handlers())
 
 
 def log_to_console_only():
@@ -207,14 +501,14 @@ def log_to_console_only():
     configure_logging(output_destinations=["stdout"])
 
 
-def log_to_file_only(log_file: str = None, log_dir: str = None):
+def log_to_file_only(log_file: str = None, log_dir: str = None, buffered: bool = False, async_queue: bool = False, rotate_daily: bool = False):
     """Configure logging to output only to file"""
-    configure_logging(output_destinations=["file"], log_file=log_file, log_dir=log_dir)
+    configure_logging(output_destinations=["file"], log_file=log_file, log_dir=log_dir, buffered=buffered, async_queue=async_queue, rotate_daily=rotate_daily)
 
 
-def log_to_console_and_file(log_file: str = None, log_dir: str = None):
+def log_to_console_and_file(log_file: str = None, log_dir: str = None, buffered: bool = False, async_queue: bool = False, rotate_daily: bool = False):
     """Configure logging to output to both console and file"""
-    configure_logging(output_destinations=["stdout", "file"], log_file=log_file, log_dir=log_dir)
+    configure_logging(output_destinations=["stdout", "file"], log_file=log_file, log_dir=log_dir, buffered=buffered, async_queue=async_queue, rotate_daily=rotate_daily)
 
 
 def log_to_stderr():
@@ -228,7 +522,9 @@ def get_log_file_path() -> str:
     if _logger is None:
         return ""
 
-    for handler in _logger.logger.handlers:
+    for handler in _logger.output_handlers():
+        # Buffered file logging wraps the FileHandler in a MemoryHandler
+        handler = getattr(handler, "target", handler)
         if isinstance(handler, logging.FileHandler):
             return handler.baseFilename
     return ""
@@ -247,32 +543,74 @@ def get_default_log_directory() -> str:
         return os.path.join(home, ".local", "share", "visual-layer", "logs")
 
 
-def list_log_files(log_dir: str = None) -> List[str]:
-    """List all log files in the log directory"""
+# The daily-rotating log file and the copies TimedRotatingFileHandler rolls it over to
+_ROTATING_LOG_NAME = re.compile(r"visual_layer_sdk\.log(\.\d{4}-\d{2}-\d{2})?")
+
+
+def _iter_log_entries(log_dir: str) -> Iterator[os.DirEntry]:
+    """Lazily yield directory entries for SDK log files, both date-stamped (visual_layer_sdk_*.log) and rotated"""
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (name.startswith("visual_layer_sdk_") and name.endswith(".log")) or _ROTATING_LOG_NAME.fullmatch(name):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def _entry_mtime(entry: os.DirEntry) -> float:
+    # DirEntry caches its stat result, so each file is stat'ed once
+    return entry.stat().st_mtime
+
+
+def _entry_name(entry: os.DirEntry) -> str:
+    return entry.name
+
+
+def list_log_files(log_dir: str = None, limit: Optional[int] = None, newest_first: bool = False) -> List[str]:
+    """
+    List log files in the log directory.
+
+    Args:
+        log_dir: Directory to scan (defaults to the standard log directory)
+        limit: Return at most this many files, selected without sorting the whole directory
+        newest_first: Order by modification time, newest first, instead of by name
+
+    Returns:
+        List of log file paths
+    """
     if log_dir is None:
         log_dir = get_default_log_directory()
 
-    if not os.path.exists(log_dir):
-        return []
-
-    log_files = []
-    for file in os.listdir(log_dir):
-        if file.startswith("visual_layer_sdk_") and file.endswith(".log"):
-            log_files.append(os.path.join(log_dir, file))
+    entries = _iter_log_entries(log_dir)
+    if newest_first:
+        entries = heapq.nlargest(limit, entries, key=_entry_mtime) if limit is not None else sorted(entries, key=_entry_mtime, reverse=True)
+    else:
+        entries = heapq.nsmallest(limit, entries, key=_entry_name) if limit is not None else sorted(entries, key=_entry_name)
 
-    return sorted(log_files)
+    return [entry.path for entry in entries]
 
 
 def get_latest_log_file(log_dir: str = None) -> str:
     """Get the path to the most recent log file"""
-    log_files = list_log_files(log_dir)
-    if log_files:
-        return log_files[-1]  # Last file is most recent
-    return ""
+    # Names of rotated and date-stamped files don't sort by age
+    log_files = list_log_files(log_dir, limit=1, newest_first=True)
+    return log_files[0] if log_files else ""
+
+
+def show_log_directory_info(quiet: Optional[bool] = None):
+    """
+    Show information about the log directory and files.
 
+    Args:
+        quiet: Skip the directory scan and print nothing. Defaults to True when stdout is not a terminal
+    """
+    if quiet is None:
+        quiet = not sys.stdout.isatty()
+    if quiet:
+        return
 
-def show_log_directory_info():
-    """Show information about the log directory and files"""
     log_dir = get_default_log_directory()
     print(f"📁 Default log directory: {log_dir}")
 
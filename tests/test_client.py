@@ -1,16 +1,27 @@
 """Tests for the VisualLayerClient."""
 
+import asyncio
+import email
+import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+import jwt
 import pandas as pd
+import pytest
 
-from src.visual_layer_sdk.client import VisualLayerClient
+from src.visual_layer_sdk.client import VisualLayerClient, _MultipartUpload
 from src.visual_layer_sdk.dataset import Dataset
 
 
 class TestVisualLayerClient:
     """Test cases for VisualLayerClient."""
 
+    def setup_method(self):
+        with patch.object(VisualLayerClient, "healthcheck", return_value={}):
+            self.client = VisualLayerClient("test_key", "test_secret")
+
     def test_client_initialization(self):
         """Test that the client initializes correctly."""
         api_key = "test_key"
@@ -33,6 +44,178 @@ class TestVisualLayerClient:
         assert jwt_token is not None
         assert isinstance(jwt_token, str)
 
+    def test_generate_jwt_verifies_with_pyjwt(self):
+        """Test that the hand-signed HS256 token is a valid JWT."""
+        secret = "test_secret" * 3
+        with patch.object(VisualLayerClient, "healthcheck", return_value={}):
+            client = VisualLayerClient("test_key", secret)
+
+        token = client._generate_jwt()
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT", "kid": "test_key"}
+        claims = jwt.decode(token, secret, algorithms=["HS256"])
+        assert claims["sub"] == "test_key"
+        assert claims["iss"] == "sdk"
+        assert claims["exp"] - claims["iat"] == 600
+
+    def test_generate_jwt_is_cached(self):
+        """Test that a JWT is reused until it is close to expiring."""
+        first = self.client._generate_jwt()
+        assert self.client._generate_jwt() is first
+        assert self.client._get_headers() is self.client._get_headers()
+        assert self.client._get_headers()["Authorization"] == f"Bearer {first}"
+
+        # Force the cached token into its refresh window
+        self.client._jwt_exp = 0
+        with patch.object(self.client, "_encode_jwt", return_value=("new_token", 2**31)) as mock_encode:
+            assert self.client._generate_jwt() == "new_token"
+            assert self.client._generate_jwt() == "new_token"
+        mock_encode.assert_called_once()
+
+    def test_bulk_get_datasets(self):
+        """Test that bulk_get_datasets returns one row per id, in order."""
+
+        def fake_details(dataset_id):
+            return {"id": dataset_id, "status": "READY"}
+
+        with patch.object(self.client, "_get_dataset_raw", side_effect=fake_details):
+            df = asyncio.run(self.client.bulk_get_datasets(["a", "b", "c"]))
+
+        assert list(df["id"]) == ["a", "b", "c"]
+        assert asyncio.run(self.client.bulk_get_datasets([])).empty
+
+    def test_dataset_details_are_cached(self):
+        """Test that repeated dataset lookups reuse the cached response unless refresh=True."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'{"id": "abc", "display_name": "Cached", "n_images": 3, "sample": false}'
+        with patch.object(self.client.session, "get", return_value=response) as mock_get:
+            first = self.client.get_dataset("abc")
+            second = self.client.get_dataset_details_as_dataframe("abc")
+            assert mock_get.call_count == 1
+            self.client.get_dataset("abc", refresh=True)
+            assert mock_get.call_count == 2
+
+        assert first.equals(second)
+        assert first.loc[0, "display_name"] == "Cached"
+        assert list(first.columns) == list(self.client.get_dataset_details("abc"))
+        assert self.client.get_dataset_details("abc")["n_images"] == 3
+        assert str(first["n_images"].dtype) == "Int64"
+        assert str(first["sample"].dtype) == "boolean"
+        assert not first.loc[0, "sample"]
+
+    def test_delete_evicts_cached_dataset(self):
+        """Test that deleting a dataset drops it from the self.client's detail and listing caches."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'{"id": "abc", "display_name": "Cached", "n_images": 3}'
+        with patch.object(self.client.session, "get", return_value=response), patch.object(Dataset, "_validate_dataset_exists", return_value=None):
+            self.client.get_dataset("abc")
+            dataset = Dataset(self.client, "abc")
+        self.client._dataset_cache.set("datasets", [{"id": "abc"}])
+
+        with patch.object(self.client.session, "delete") as mock_delete:
+            mock_delete.return_value.json.return_value = {"deleted": True}
+            dataset.delete()
+        assert self.client._dataset_cache.get("abc") is None
+        assert self.client._dataset_cache.get("datasets") is None
+
+    def test_bulk_create_datasets_from_s3(self):
+        """Test that bulk S3 creation posts a pre-encoded form body per dataset, in order."""
+        response = MagicMock()
+        response.content = b'{"id": "ds-1"}'
+        items = [{"s3_bucket_path": "s3://bucket/a", "dataset_name": "a"}, {"s3_bucket_path": "s3://bucket/b", "dataset_name": "b"}]
+        with patch.object(self.client.session, "post", return_value=response) as mock_post, patch("src.visual_layer_sdk.client.Dataset") as mock_dataset:
+            datasets = asyncio.run(self.client.bulk_create_datasets_from_s3(items))
+
+        assert len(datasets) == 2
+        assert mock_dataset.call_count == 2
+        bodies = sorted(call.kwargs["data"] for call in mock_post.call_args_list)
+        assert all(isinstance(body, bytes) for body in bodies)
+        assert b"dataset_name=a&" in bodies[0] and b"bucket_path=s3%3A%2F%2Fbucket%2Fb" in bodies[1]
+
+    def test_get_datasets_details(self):
+        """Test that threaded detail lookups return one row per id, in order."""
+        with patch.object(self.client, "_get_dataset_raw", side_effect=lambda dataset_id: {"id": dataset_id, "n_images": 1}):
+            df = self.client.get_datasets_details(["a", "b", "c"], max_workers=4)
+
+        assert list(df["id"]) == ["a", "b", "c"]
+        assert self.client.get_datasets_details([]).empty
+
+    def test_raw_zip_upload(self, tmp_path):
+        """Test that use_multipart=False uploads the zip as a raw application/zip body."""
+        zip_path = tmp_path / "images.zip"
+        zip_path.write_bytes(b"PK\x03\x04zip")
+        response = MagicMock()
+        response.content = b'{"id": "ds-1"}'
+        uploads = []
+
+        def fake_post(url, data=None, params=None, headers=None, **kwargs):
+            if url.endswith("/upload"):
+                uploads.append((data.read(), params, headers))
+            return response
+
+        with patch.object(self.client.session, "post", side_effect=fake_post), patch("src.visual_layer_sdk.client.Dataset"):
+            self.client.create_dataset_from_local_folder(str(zip_path), "images.zip", "ds", use_multipart=False)
+
+        body, params, headers = uploads[0]
+        assert body == b"PK\x03\x04zip"
+        assert params == {"operations": "READ"}
+        assert headers["Content-Type"] == "application/zip"
+        assert headers["Content-Disposition"] == 'attachment; filename="images.zip"'
+
+    def test_local_upload_falls_back_when_mmap_fails(self, tmp_path):
+        """Test that the zip is streamed from the plain file when it cannot be memory-mapped."""
+        zip_path = tmp_path / "images.zip"
+        zip_path.write_bytes(b"PK\x03\x04zip")
+        response = MagicMock()
+        response.content = b'{"id": "ds-1"}'
+        uploads = []
+
+        def fake_post(url, data=None, params=None, headers=None, **kwargs):
+            if url.endswith("/upload"):
+                uploads.append(data.read())
+            return response
+
+        with (
+            patch("src.visual_layer_sdk.client.mmap.mmap", side_effect=OSError("mmap unsupported")),
+            patch.object(self.client.session, "post", side_effect=fake_post),
+            patch("src.visual_layer_sdk.client.Dataset"),
+        ):
+            self.client.create_dataset_from_local_folder(str(zip_path), "images.zip", "ds", use_multipart=False)
+
+        assert uploads == [b"PK\x03\x04zip"]
+
+    def test_local_upload_missing_file(self, tmp_path):
+        """Test that a missing zip raises ValueError before any dataset is created."""
+        with patch.object(self.client.session, "post") as mock_post:
+            with pytest.raises(ValueError, match="File not found"):
+                self.client.create_dataset_from_local_folder(str(tmp_path / "missing.zip"), "missing.zip", "ds")
+        mock_post.assert_not_called()
+
+    def test_local_upload_unreadable_path(self, tmp_path):
+        """Test that a path that cannot be opened as a file raises ValueError before any dataset is created."""
+        with patch.object(self.client.session, "post") as mock_post:
+            with pytest.raises(ValueError, match="Cannot read file"):
+                self.client.create_dataset_from_local_folder(str(tmp_path), "images.zip", "ds")
+        mock_post.assert_not_called()
+
+    def test_multipart_upload_body(self, tmp_path):
+        """Test that the streamed upload body is valid multipart with the file contents."""
+        payload = bytes(range(256)) * 100
+        zip_path = tmp_path / "images.zip"
+        zip_path.write_bytes(payload)
+
+        with open(zip_path, "rb") as f:
+            body = _MultipartUpload({"operations": "READ"}, "file", "images.zip", f, "application/zip")
+            raw = body.read(1000) + body.read()
+
+        assert len(raw) == len(body)
+        message = email.message_from_bytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw)
+        form, upload = message.get_payload()
+        assert form.get_payload() == "READ"
+        assert upload.get_filename() == "images.zip"
+        assert upload.get_payload(decode=True) == payload
+
     def test_get_headers(self):
         """Test header generation."""
         api_key = "test_key"
@@ -58,6 +241,96 @@ class TestVisualLayerClient:
         assert headers["accept"] == "application/json"
         assert headers["Content-Type"] == "application/json"
 
+    def test_configure_logging_restores_level_after_client_quieting(self):
+        import logging
+
+        from src.visual_layer_sdk import client as client_module
+        from src.visual_layer_sdk.logger import configure_logging
+
+        sdk_logger = logging.getLogger("visual_layer_sdk")
+        previous_level = sdk_logger.level
+        try:
+            configure_logging(output_destinations=["stdout"], level=logging.INFO)
+            with patch.object(client_module, "_LOGGING_CONFIGURED", False):
+                client_module._quiet_sdk_logging()
+            assert sdk_logger.level == logging.WARNING
+            configure_logging(output_destinations=["stdout"], level=logging.INFO)
+            assert sdk_logger.level == logging.INFO
+        finally:
+            sdk_logger.setLevel(previous_level)
+
+    def test_configure_logging_opens_new_dated_file_on_a_new_day(self, tmp_path):
+        import logging
+
+        from src.visual_layer_sdk import logger as logger_module
+
+        sdk_logger = logging.getLogger("visual_layer_sdk")
+        previous_level = sdk_logger.level
+        try:
+            with patch.object(logger_module, "datetime") as mock_datetime:
+                mock_datetime.now.return_value.strftime.return_value = "2025-01-01"
+                logger_module.configure_logging(output_destinations=["file"], log_dir=str(tmp_path))
+                mock_datetime.now.return_value.strftime.return_value = "2025-01-02"
+                logger_module.configure_logging(output_destinations=["file"], log_dir=str(tmp_path))
+            assert [os.path.basename(handler.baseFilename) for handler in sdk_logger.handlers] == ["visual_layer_sdk_2025-01-02.log"]
+        finally:
+            logger_module.configure_logging(output_destinations=["stdout"])
+            sdk_logger.setLevel(previous_level)
+
+    def test_batches_in_interleaved_threads_keep_logger_handlers(self):
+        import logging
+        import logging.handlers
+
+        from src.visual_layer_sdk.logger import get_logger
+
+        logger = get_logger()
+        handlers = logger.logger.handlers[:]
+        previous_level = logger.logger.level
+        output = logging.handlers.BufferingHandler(capacity=1000)
+        logger.logger.addHandler(output)
+        logger.logger.setLevel(logging.INFO)
+        a_entered, b_entered, a_exited, unbatched_logged = threading.Event(), threading.Event(), threading.Event(), threading.Event()
+
+        def batch_a():
+            with logger.batch():
+                logger.info("a1")
+                a_entered.set()
+                b_entered.wait(5)
+                logger.info("a2")
+            a_exited.set()
+
+        def batch_b():
+            a_entered.wait(5)
+            with logger.batch():
+                logger.info("b1")
+                b_entered.set()
+                unbatched_logged.wait(5)
+                logger.info("b2")
+
+        try:
+            threads = [threading.Thread(target=batch_a), threading.Thread(target=batch_b)]
+            for thread in threads:
+                thread.start()
+            a_exited.wait(5)
+            logger.info("unbatched")
+            unbatched_logged.set()
+            for thread in threads:
+                thread.join(5)
+            assert logger.logger.handlers == handlers + [output]
+            assert [record.getMessage() for record in output.buffer] == ["a1", "a2", "unbatched", "b1", "b2"]
+        finally:
+            logger.logger.removeHandler(output)
+            logger.logger.setLevel(previous_level)
+
+    def test_list_log_files_matches_sdk_log_names(self, tmp_path):
+        from src.visual_layer_sdk.logger import list_log_files
+
+        names = ["visual_layer_sdk_20250101.log", "visual_layer_sdk.log", "visual_layer_sdk.log.2025-01-02", "visual_layer_sdk_backup.log.gz", "visual_layer_sdk.logging.txt"]
+        for name in names:
+            (tmp_path / name).touch()
+        listed = sorted(os.path.basename(path) for path in list_log_files(str(tmp_path)))
+        assert listed == ["visual_layer_sdk.log", "visual_layer_sdk.log.2025-01-02", "visual_layer_sdk_20250101.log"]
+
 
 class TestDatasetSearch:
     pass  # Removed test_search_by_visual_similarity due to missing image file
@@ -87,6 +360,25 @@ class TestDatasetRegression:
             details = self.dataset.get_details()
             assert details["id"] == "test"
 
+    def test_get_details_is_briefly_cached(self):
+        with patch.object(self.dataset.client.session, "get") as mock_get, patch.object(self.dataset, "_get_user_config", return_value={}):
+            mock_get.return_value.json.return_value = {"id": "test", "status": "READY"}
+            mock_get.return_value.raise_for_status = MagicMock()
+            assert self.dataset.get_status() == "READY"
+            assert self.dataset.get_details()["id"] == "test"
+            assert mock_get.call_count == 1
+            self.dataset.invalidate_details()
+            self.dataset.get_details()
+            assert mock_get.call_count == 2
+
+    def test_user_config_is_cached(self):
+        with patch.object(self.dataset.client.session, "get") as mock_get:
+            mock_get.return_value.json.return_value = {"features": [{"feature_key": "TEXTUAL_SEARCH_IMAGE", "feature_options": {"labels_search": True}}]}
+            mock_get.return_value.raise_for_status = MagicMock()
+            assert self.dataset._get_user_config()["labels_search"] is True
+            assert self.dataset._get_user_config()["labels_search"] is True
+            assert mock_get.call_count == 1
+
     def test_explore(self):
         with patch.object(self.dataset.client.session, "get") as mock_get:
             mock_get.return_value.json.return_value = {"clusters": [{"previews": [{"id": 1}]}]}
@@ -116,6 +408,26 @@ class TestDatasetRegression:
                 assert not df.empty
                 assert "id" in df.columns
 
+    def test_export_to_dataframe_stream(self):
+        fake_ijson = MagicMock()
+        fake_ijson.items.return_value = iter([{"id": 1, "metadata_items": [{"type": "caption"}]}, {"id": 2}])
+        with (
+            patch("src.visual_layer_sdk.dataset.ijson", fake_ijson),
+            patch.object(self.dataset, "get_status", return_value="READY"),
+            patch.object(self.dataset.client.session, "get") as mock_get,
+        ):
+            response = mock_get.return_value.__enter__.return_value = mock_get.return_value
+            response.raise_for_status = MagicMock()
+            df = self.dataset.export_to_dataframe(stream=True)
+        assert list(df["id"]) == [1, 2]
+        assert "metadata_items" not in df.columns
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert fake_ijson.items.call_args.args[:2] == (response.raw, "media_items.item")
+
+    def test_export_to_dataframe_stream_requires_ijson(self):
+        with patch("src.visual_layer_sdk.dataset.ijson", None), pytest.raises(ImportError, match="ijson"):
+            self.dataset.export_to_dataframe(stream=True)
+
     def test_process_export_download_to_dataframe(self):
         pass  # Removed due to AttributeError
 
@@ -133,9 +445,142 @@ class TestDatasetRegression:
             assert not df.empty
             mock_vql.assert_called()
 
+    def test_search_by_issues_one_of_combines_results(self):
+        from src.visual_layer_sdk.dataset import IssueType, SearchOperator
+
+        def fake_vql(vql, entity_type):
+            issue = vql[0]["issues"]["value"]
+            return pd.DataFrame({"media_id": ["shared", issue]})
+
+        with patch.object(self.dataset, "search_by_vql", side_effect=fake_vql) as mock_vql:
+            df = self.dataset.search_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_ONE_OF)
+            assert mock_vql.call_count == 2
+        assert list(df["media_id"]) == ["shared", "blur", "dark"]
+
+    def test_search_by_labels_is_not_excludes_matches(self):
+        from src.visual_layer_sdk.dataset import SearchOperator
+
+        all_images = pd.DataFrame({"media_id": ["a", "b", "c"]})
+        with (
+            patch.object(self.dataset, "_get_user_config", return_value={"labels_search": True}),
+            patch.object(self.dataset, "export_to_dataframe", return_value=all_images),
+            patch.object(self.dataset, "search_by_vql", return_value=pd.DataFrame({"media_id": ["b"]})),
+        ):
+            df = self.dataset.search_by_labels(["cat"], search_operator=SearchOperator.IS_NOT)
+        assert list(df["media_id"]) == ["a", "c"]
+
+    def test_all_except_returns_without_waiting_on_empty_export(self):
+        release = threading.Event()
+        with patch.object(self.dataset, "export_to_dataframe", return_value=pd.DataFrame()):
+            start = time.monotonic()
+            df = self.dataset._all_except(lambda: release.wait(5) and pd.DataFrame())
+            elapsed = time.monotonic() - start
+        release.set()
+        assert df.empty
+        assert elapsed < 1
+
+    def test_all_except_stops_abandoned_search_polling(self):
+        def empty_export(stream=False):
+            time.sleep(0.4)  # let the positive search start polling
+            return pd.DataFrame()
+
+        with patch.object(self.dataset.client.session, "get") as mock_get, patch.object(self.dataset, "export_to_dataframe", side_effect=empty_export):
+            mock_get.return_value.json.return_value = {"status": "IN_PROGRESS", "id": "task-1"}
+            mock_get.return_value.raise_for_status = MagicMock()
+            self.dataset._all_except(lambda: self.dataset.search_by_vql([{"issues": {"op": "issue", "value": "blur", "mode": "in"}}]))
+            time.sleep(0.2)
+            calls = mock_get.call_count
+            time.sleep(1)
+            assert calls >= 1
+            assert mock_get.call_count == calls
+
+    def test_search_by_issues_single_is_not_runs_on_server(self):
+        from src.visual_layer_sdk.dataset import IssueType, SearchOperator
+
+        with patch.object(self.dataset, "export_to_dataframe") as mock_export, patch.object(self.dataset, "search_by_vql", return_value=pd.DataFrame({"media_id": ["a"]})) as mock_vql:
+            self.dataset.search_by_issues(issue_type=IssueType.BLUR, search_operator=SearchOperator.IS_NOT)
+        mock_export.assert_not_called()
+        assert mock_vql.call_args.args[0][0]["issues"]["mode"] == "out"
+
+    def test_list_available_issue_types(self):
+        issue_types = Dataset.list_available_issue_types()
+        assert issue_types[3]["name"] == "blur"
+        issue_types[3]["name"] = "changed"
+        assert Dataset.list_available_issue_types()[3]["name"] == "blur"
+
+    def test_get_issue_type_info(self):
+        assert Dataset.get_issue_type_info(issue_id=3)["name"] == "blur"
+        assert Dataset.get_issue_type_info(issue_name="duplicates")["id"] == 2
+        assert type(Dataset.get_issue_type_info(issue_id=3)) is dict
+        with pytest.raises(ValueError):
+            Dataset.get_issue_type_info(issue_name="unknown")
+
+    def test_count_by_issues(self):
+        from src.visual_layer_sdk.dataset import IssueType, SearchOperator
+
+        items = [{"media_id": "a"}, {"media_id": "b"}]
+        with patch.object(self.dataset, "_search_media_items_by_vql", return_value=items) as mock_items:
+            count = self.dataset.count_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_ONE_OF)
+            assert count == 2
+            assert mock_items.call_count == 2
+
+    def test_issue_search_plan_is_shared_by_search_and_count(self):
+        from src.visual_layer_sdk.dataset import IssueType, SearchOperator
+
+        assert self.dataset._issue_search_plan(IssueType.BLUR, "bogus", 0.8, 1.0) == (None, [])
+        plan, vqls = self.dataset._issue_search_plan([IssueType.BLUR, IssueType.DARK], SearchOperator.IS_NOT_ONE_OF, 0.5, 1.0)
+        assert plan == "search"
+        assert [f["issues"]["mode"] for f in vqls[0]] == ["out", "out"]
+
+        with patch.object(self.dataset, "search_by_vql", return_value=pd.DataFrame({"media_id": ["a", "b"]})) as mock_vql, patch.object(self.dataset, "count_by_vql", return_value=2) as mock_count:
+            searched = self.dataset.search_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_NOT_ONE_OF, confidence_min=0.5)
+            counted = self.dataset.count_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_NOT_ONE_OF, confidence_min=0.5)
+        assert counted == len(searched)
+        assert mock_vql.call_args.args[0] == mock_count.call_args.args[0] == vqls[0]
+
+    def test_count_by_issues_one_of_runs_concurrently(self):
+        from src.visual_layer_sdk.dataset import IssueType, SearchOperator
+
+        # Each search waits for the other, so this only completes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_items(vql, entity_type):
+            barrier.wait()
+            return [{"media_id": vql[0]["issues"]["value"]}, {"media_id": "shared"}]
+
+        with patch.object(self.dataset, "_search_media_items_by_vql", side_effect=fake_items):
+            count = self.dataset.count_by_issues(issue_type=[IssueType.BLUR, IssueType.DARK], search_operator=SearchOperator.IS_ONE_OF)
+        assert count == 3
+
     def test_search_by_vql(self):
         pass  # Removed due to AttributeError
 
+    def test_search_by_vql_rejects_bad_vql_type(self):
+        with pytest.raises(TypeError, match="vql must be"):
+            self.dataset.search_by_vql(42)
+
+    def test_search_by_vql_json_string(self):
+        vql = '[{"issues": {"op": "issue", "value": "blur", "mode": "in"}}]'
+        with patch.object(self.dataset.client.session, "get") as mock_get:
+            mock_get.return_value.json.return_value = {"status": "REJECTED"}
+            mock_get.return_value.raise_for_status = MagicMock()
+            df = self.dataset.search_by_vql(vql)
+            assert df.empty
+            assert mock_get.call_args.kwargs["params"]["vql"] == vql
+
+    def test_vql_export_polling_backs_off(self):
+        statuses = [{"status": "PENDING", "id": "task"}] + [{"status": "PENDING"}] * 6 + [{"status": "COMPLETED", "download_uri": "https://example.com/export.zip"}]
+        with patch.object(self.dataset.client.session, "get") as mock_get, patch("src.visual_layer_sdk.dataset.time.sleep") as mock_sleep:
+            mock_get.return_value.json.side_effect = statuses
+            self.dataset.poll_interval = 2
+            assert self.dataset._wait_for_vql_export([{"labels": {"op": "one_of", "value": ["cat"]}}], "IMAGES") == "https://example.com/export.zip"
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 7
+        assert 0.25 <= delays[0] < 0.35
+        assert all(later >= earlier - 0.1 for earlier, later in zip(delays, delays[1:]))
+        assert all(delay <= 2.1 for delay in delays)
+
     def test_download_export_results(self):
         pass  # Removed due to AttributeError
 